@@ -0,0 +1,253 @@
+"""
+  Reproducible benchmark suite for the EDA class
+
+  Generates synthetic DataFrames with a controlled number of rows, columns, null rate, cardinality and dtypes,
+  then times and memory-profiles every EDA method under the headless Agg backend. Results are written as JSON and
+  can be compared against a stored baseline. Everything runs offline.
+
+  Usage:
+    python benchmarks/benchmark_eda.py --sizes 1e4 1e5 1e6 --output results.json
+    python benchmarks/benchmark_eda.py --output new.json --baseline results.json --tolerance 1.2
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from exploratory_data_anaylsis import EDA
+
+
+METHODS = ['__init__', 'check_null', 'remove_null', 'encode', 'scaling', 'heatmap', 'boxplot', 'bar_graph', 'hist', 'density', 'scatter']
+PLOT_METHODS = ['heatmap', 'boxplot', 'bar_graph', 'hist', 'density', 'scatter']
+
+# The make_frame options that decide what the data looks like; results are only comparable when they match
+FRAME_OPTIONS = ['numeric_columns', 'categorical_columns', 'null_rate', 'cardinality', 'seed']
+
+
+def make_frame(rows, numeric_columns=8, categorical_columns=4, null_rate=0.05, cardinality=50, seed=0):
+    """
+      Build a synthetic DataFrame
+
+      Args:
+        rows (int): The number of rows
+        numeric_columns (int, optional, defaults to 8): The number of numeric columns; half are float64 and half are int64
+        categorical_columns (int, optional, defaults to 4): The number of object columns
+        null_rate (float, optional, defaults to 0.05): The fraction of values in each float and object column that are null
+        cardinality (int, optional, defaults to 50): The number of unique values in each object column
+        seed (int, optional, defaults to 0): Seed for the random values, so the same arguments always give the same frame
+
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+
+    for i in range(numeric_columns):
+        if i % 2 == 0:
+            values = rng.normal(loc=i, scale=1 + i, size=rows)
+            values[rng.random(rows) < null_rate] = np.nan
+            data[f'float_{i}'] = values
+        else:
+            # Integer columns cannot hold NaN, so they stay complete
+            data[f'int_{i}'] = rng.integers(0, 1000, size=rows)
+
+    labels = np.array([f'category_{k}' for k in range(cardinality)], dtype=object)
+    for i in range(categorical_columns):
+        values = labels[rng.integers(0, cardinality, size=rows)]
+        values[rng.random(rows) < null_rate] = None
+        data[f'cat_{i}'] = values
+
+    return pd.DataFrame(data)
+
+
+def run_method(name, data):
+    """
+      Build an EDA instance on a shallow copy of data and run one method on it
+
+      The plotting methods only build figures, so their figures are drawn on the Agg canvas before returning and
+      rasterization is part of what is measured. Returns the EDA instance for __init__ and the method's result otherwise
+    """
+    result = call_method(name, data)
+    if name in PLOT_METHODS:
+        for number in plt.get_fignums():
+            plt.figure(number).canvas.draw()
+    return result
+
+
+def call_method(name, data):
+    """
+      Build an EDA instance on a shallow copy of data and call one method on it
+    """
+    if name == '__init__':
+        return EDA(data.copy(deep=False), autologger=True)
+
+    eda = EDA(data.copy(deep=False), autologger=True)
+    numeric = list(eda.numeric.columns)
+
+    if name == 'check_null':
+        return eda.check_null()
+    if name == 'remove_null':
+        return eda.remove_null(remove_null_under_5=True, remove_column_under_60=True)
+    if name == 'encode':
+        return eda.encode()
+    if name == 'scaling':
+        return eda.scaling('StandardScaler')
+    if name == 'heatmap':
+        return eda.heatmap()
+    if name == 'boxplot':
+        return eda.boxplot(variables=numeric)
+    if name == 'bar_graph':
+        return eda.bar_graph()
+    if name == 'hist':
+        return eda.hist(variables=numeric)
+    if name == 'density':
+        return eda.density(variables=numeric)
+    if name == 'scatter':
+        return eda.scatter(numeric[:-1], numeric[1:])
+    raise ValueError(f'Unknown method {name}')
+
+
+def measure(name, data, repeat):
+    """
+      Time and memory-profile one method; the wall time is the best of repeat runs and the peak memory is taken
+      from a separate run under tracemalloc so tracing does not slow down the timed runs
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_method(name, data)
+        times.append(time.perf_counter() - start)
+        plt.close('all')
+
+    tracemalloc.start()
+    run_method(name, data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    plt.close('all')
+
+    best = min(times)
+    return {'wall_time_s': best, 'rows_per_s': len(data) / best if best > 0 else None, 'peak_memory_bytes': peak}
+
+
+def run_suite(sizes, methods, repeat, frame_options):
+    """
+      Run every method at every size and return the results as a JSON-ready dictionary
+    """
+    results = {
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'matplotlib': matplotlib.__version__,
+            'platform': platform.platform(),
+            'backend': matplotlib.get_backend(),
+        },
+        'config': {'sizes': sizes, 'methods': methods, 'repeat': repeat, **frame_options},
+        'results': [],
+    }
+
+    for rows in sizes:
+        data = make_frame(rows, **frame_options)
+        for name in methods:
+            result = measure(name, data, repeat)
+            results['results'].append({'rows': rows, 'columns': data.shape[1], 'method': name, **result})
+            print(f"{rows:>12,} rows  {name:<12} {result['wall_time_s']:>10.4f} s  {result['peak_memory_bytes'] / 2 ** 20:>10.1f} MiB", flush=True)
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+      Compare results against a baseline and return the (rows, method, metric, ratio) entries where the wall time
+      or the peak memory grew by more than tolerance
+
+      Raises a ValueError when the baseline was generated with different data options (see FRAME_OPTIONS), and
+      warns when it was run in a different environment
+    """
+    differences = {key: (baseline['config'].get(key), results['config'].get(key)) for key in FRAME_OPTIONS
+                   if baseline['config'].get(key) != results['config'].get(key)}
+    if differences:
+        raise ValueError(f'The baseline was run on different data, so the results cannot be compared; (baseline, current) values: {differences}')
+
+    environment = baseline.get('environment', {})
+    changed = [key for key, value in results['environment'].items() if environment.get(key) != value]
+    if changed:
+        print(f"Warning: the environment differs from the baseline ({', '.join(changed)}), so differences may not come from the code")
+
+    previous = {(entry['rows'], entry['method']): entry for entry in baseline['results']}
+    regressions = []
+
+    def ratio(entry, key, metric):
+        return entry[metric] / previous[key][metric] if previous[key][metric] > 0 else float('inf')
+
+    print(f"\n{'rows':>12}  {'method':<12} {'baseline s':>10} {'current s':>10} {'ratio':>7}  {'baseline MiB':>12} {'current MiB':>12} {'ratio':>7}")
+    for entry in results['results']:
+        key = (entry['rows'], entry['method'])
+        if key not in previous:
+            continue
+        time_ratio = ratio(entry, key, 'wall_time_s')
+        memory_ratio = ratio(entry, key, 'peak_memory_bytes')
+        flag = ('  SLOWER' if time_ratio > tolerance else '') + ('  MORE MEMORY' if memory_ratio > tolerance else '')
+        print(f"{entry['rows']:>12,}  {entry['method']:<12} {previous[key]['wall_time_s']:>10.4f} {entry['wall_time_s']:>10.4f} {time_ratio:>7.2f}  "
+              f"{previous[key]['peak_memory_bytes'] / 2 ** 20:>12.1f} {entry['peak_memory_bytes'] / 2 ** 20:>12.1f} {memory_ratio:>7.2f}{flag}")
+        if time_ratio > tolerance:
+            regressions.append((entry['rows'], entry['method'], 'wall_time_s', time_ratio))
+        if memory_ratio > tolerance:
+            regressions.append((entry['rows'], entry['method'], 'peak_memory_bytes', memory_ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark every EDA method on synthetic data')
+    parser.add_argument('--sizes', nargs='+', type=float, default=[1e4, 1e5, 1e6], help='Row counts to benchmark (from 1e4 up to 1e8)')
+    parser.add_argument('--methods', nargs='+', default=METHODS, choices=METHODS, help='Methods to benchmark')
+    parser.add_argument('--numeric-columns', type=int, default=8)
+    parser.add_argument('--categorical-columns', type=int, default=4)
+    parser.add_argument('--null-rate', type=float, default=0.05)
+    parser.add_argument('--cardinality', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per method; the best is kept')
+    parser.add_argument('--output', default='benchmark_results.json', help='Where the JSON results are written')
+    parser.add_argument('--baseline', default=None, help='JSON results of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=1.2, help='Wall time or peak memory ratio against the baseline that counts as a regression')
+    args = parser.parse_args(argv)
+
+    frame_options = {
+        'numeric_columns': args.numeric_columns,
+        'categorical_columns': args.categorical_columns,
+        'null_rate': args.null_rate,
+        'cardinality': args.cardinality,
+        'seed': args.seed,
+    }
+    results = run_suite([int(size) for size in args.sizes], args.methods, args.repeat, frame_options)
+
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f'\nResults written to {args.output}')
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        try:
+            regressions = compare(results, baseline, args.tolerance)
+        except ValueError as error:
+            print(f'\n{error}')
+            return 2
+        if regressions:
+            print(f'\n{len(regressions)} measurement(s) are more than {args.tolerance}x above the baseline in wall time or peak memory')
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+  Import-time regression check for statistics-only workloads
+
+  Imports exploratory_data_anaylsis in a fresh interpreter, runs check_null, remove_null, encode and scaling, and
+  fails if matplotlib or seaborn got imported along the way or if the import took longer than the allowed time.
+
+  Usage:
+    python benchmarks/check_import.py --max-import-seconds 1.0
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Runs in a fresh interpreter so nothing imported by this script leaks into the measurement
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import exploratory_data_anaylsis
+import_seconds = time.perf_counter() - start
+
+import numpy as np
+import pandas as pd
+data = pd.DataFrame({
+    'number': np.r_[np.arange(99, dtype=float), np.nan],
+    'label': pd.Series(['a', 'b', None, 'c'] * 25, dtype=object),
+})
+eda = exploratory_data_anaylsis.EDA(data)
+eda.check_null()
+eda.remove_null()
+eda.encode()
+eda.scaling('StandardScaler')
+
+print(json.dumps({
+    'import_seconds': import_seconds,
+    'plotting_modules': sorted(name for name in ('matplotlib', 'matplotlib.pyplot', 'seaborn') if name in sys.modules),
+}))
+'''
+
+
+def run_probe():
+    """
+      Run the probe in a fresh interpreter and return its import time and the plotting modules it ended up importing
+    """
+    completed = subprocess.run([sys.executable, '-c', PROBE], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check that statistics-only use of EDA does not import plotting libraries')
+    parser.add_argument('--max-import-seconds', type=float, default=1.0, help='The longest the module import may take')
+    args = parser.parse_args(argv)
+
+    result = run_probe()
+
+    print(f"Import took {result['import_seconds']:.3f} s")
+    failures = []
+    if result['plotting_modules']:
+        failures.append(f"statistics-only use imported {', '.join(result['plotting_modules'])}")
+    if result['import_seconds'] > args.max_import_seconds:
+        failures.append(f"import took longer than {args.max_import_seconds} s")
+
+    for failure in failures:
+        print(f'FAIL: {failure}')
+    if not failures:
+        print('OK: no plotting libraries were imported')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
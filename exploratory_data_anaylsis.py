@@ -1,7 +1,922 @@
+import functools
+import importlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+
+def _select_backend():
+    """
+      Use the headless Agg backend when there is no display to draw on, unless a backend was already chosen
+      through MPLBACKEND (as Jupyter does) or by importing pyplot
+    """
+    if 'matplotlib.pyplot' in sys.modules or os.environ.get('MPLBACKEND'):
+        return
+    if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        import matplotlib
+        matplotlib.use('Agg')
+
+
+class _LazyModule():
+    """
+      Stand-in for a module that is only imported the first time one of its attributes is used, so that
+      statistics-only workloads never pay for importing matplotlib and seaborn
+
+      Parameters:
+        name (str): The name of the module
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            _select_backend()
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+plt = _LazyModule('matplotlib.pyplot')
+sns = _LazyModule('seaborn')
+
+
+class _Moments():
+    """
+      Mergeable running count, mean, variance, min and max for a block of numeric columns
+
+      Parameters:
+        n_columns (int): The number of columns being tracked
+    """
+    def __init__(self, n_columns):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, block):
+        """
+          Fold a 2D float array (rows x columns) into the running moments; NaN values are ignored
+        """
+        block = np.asarray(block, dtype=float)
+        if block.shape[0] == 0:
+            return self
+
+        valid = ~np.isnan(block)
+        count = valid.sum(axis=0).astype(float)
+        total = np.where(valid, block, 0.0).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, total / count, 0.0)
+        m2 = np.where(valid, (block - mean) ** 2, 0.0).sum(axis=0)
+
+        other = _Moments(block.shape[1])
+        other.count, other.mean, other.m2 = count, mean, m2
+        other.min = np.where(count > 0, np.where(valid, block, np.inf).min(axis=0), np.inf)
+        other.max = np.where(count > 0, np.where(valid, block, -np.inf).max(axis=0), -np.inf)
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+          Combine another _Moments into this one using Chan's parallel update
+        """
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.where(count > 0, other.count / count, 0.0)
+            self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * ratio
+        self.mean = self.mean + delta * ratio
+        self.count = count
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    def add_columns(self, n_columns):
+        """
+          Start tracking n_columns more columns, which have not seen any values yet
+        """
+        self.count = np.concatenate([self.count, np.zeros(n_columns)])
+        self.mean = np.concatenate([self.mean, np.zeros(n_columns)])
+        self.m2 = np.concatenate([self.m2, np.zeros(n_columns)])
+        self.min = np.concatenate([self.min, np.full(n_columns, np.inf)])
+        self.max = np.concatenate([self.max, np.full(n_columns, -np.inf)])
+        return self
+
+    @property
+    def std(self):
+        """
+          Sample standard deviation (ddof=1), NaN where fewer than two values were seen
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+
+class _QuantileSketch():
+    """
+      Mergeable approximate quantile sketch in the style of KLL: values are kept in levels whose weight doubles
+      each level up, and a level is compacted by sorting it and promoting every other value once it exceeds k
+
+      Parameters:
+        k (int, optional, defaults to 1024): Capacity of each level; larger values give more accurate quantiles
+        random_state (int, optional, defaults to 0): Seed used to pick which half of a level is promoted
+    """
+    def __init__(self, k=1024, random_state=0):
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(random_state)
+
+    def update(self, values):
+        """
+          Add a 1D array of values to the sketch; NaN values are ignored
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compact()
+        return self
+
+    def merge(self, other):
+        """
+          Combine another sketch into this one
+        """
+        for height, level in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[height] = np.concatenate([self.levels[height], level])
+        self.count += other.count
+        self._compact()
+        return self
+
+    def _compact(self):
+        height = 0
+        while height < len(self.levels):
+            level = self.levels[height]
+            if len(level) > self.k:
+                level = np.sort(level)
+                # An odd value out stays behind so no weight is lost
+                keep, level = level[:len(level) % 2], level[len(level) % 2:]
+                promoted = level[self._rng.integers(2)::2]
+                self.levels[height] = keep
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+            height += 1
+
+    def quantile(self, q):
+        """
+          Estimate one or more quantiles (between 0 and 1) of every value seen so far
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.count == 0:
+            return np.full(len(q), np.nan)
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** height) for height, level in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values, weights = values[order], weights[order]
+
+        # Position each value at the middle of the weight it represents, then interpolate between positions
+        cumulative = np.cumsum(weights)
+        positions = (cumulative - weights / 2) / cumulative[-1]
+        return np.interp(q, positions, values)
+
+
+def _is_numeric_dtype(dtype):
+    """
+      Whether a dtype counts as numeric the way select_dtypes(include=np.number) sees it, which excludes booleans
+    """
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+class _ChunkAccumulator():
+    """
+      Builds summary statistics, null counts, quantile sketches, categorical value counts and a uniform row sample
+      from a stream of DataFrame chunks without ever holding more than one chunk in memory
+
+      Parameters:
+        sample_size (int): The maximum number of rows kept in the uniform random sample
+        random_state (int, optional, defaults to 0): Seed for the row sample and the quantile sketches
+        max_categories (int, optional, defaults to 10,000): The most distinct values whose counts are kept for each categorical column
+    """
+    def __init__(self, sample_size, random_state=0, max_categories=10_000):
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self.max_categories = max_categories
+        self._rng = np.random.default_rng(random_state)
+
+        self.columns = None
+        self.numeric_columns = None
+        self.categorical_columns = None
+        self.rows = 0
+        self.null_counts = None
+        self.moments = None
+        self.sketches = None
+        self.value_counts = None
+        self.truncated_columns = []
+
+        self.sample = None
+        self._sample_keys = np.empty(0)
+        self._sample_rows = np.empty(0, dtype=np.int64)
+
+        # Columns that have only held nulls so far, with the dtype they had in the latest chunk
+        self._undecided = {}
+        self._coerced_columns = set()
+
+    def update(self, chunk):
+        """
+          Fold one DataFrame chunk into the accumulators
+        """
+        if self.columns is None:
+            self.columns = chunk.columns
+            self.numeric_columns = []
+            self.categorical_columns = []
+            self.null_counts = pd.Series(0, index=self.columns, dtype=np.int64)
+            self.moments = _Moments(0)
+            self.sketches = {}
+            self.value_counts = {}
+            self._undecided = dict(chunk.dtypes.items())
+
+        null_counts = chunk.isna().sum()
+        self.null_counts = self.null_counts.add(null_counts, fill_value=0).astype(np.int64)
+
+        # read_csv infers dtypes chunk by chunk, so a column is only classified as numeric or categorical once a
+        # chunk has a value in it; a column that is all null so far would otherwise be read as float
+        self._undecided.update({column: chunk[column].dtype for column in self._undecided})
+        self._classify([column for column in self._undecided if null_counts[column] < len(chunk)])
+
+        numeric = chunk[self.numeric_columns]
+        mismatched = [column for column in self.numeric_columns if not _is_numeric_dtype(numeric[column].dtype)]
+        if mismatched:
+            new = [column for column in mismatched if column not in self._coerced_columns]
+            if new:
+                warnings.warn(f'Columns {new} were numeric in earlier chunks but contain non-numeric values in a later chunk; '
+                              'those values are treated as null. Pass dtype= to set the column types explicitly', stacklevel=4)
+                self._coerced_columns.update(new)
+            numeric = numeric.copy(deep=False)
+            for column in mismatched:
+                numeric[column] = pd.to_numeric(numeric[column], errors='coerce')
+
+        block = numeric.to_numpy(dtype=float, na_value=np.nan)
+        self.moments.update(block)
+        for i, column in enumerate(self.numeric_columns):
+            self.sketches[column].update(block[:, i])
+
+        for column in self.categorical_columns:
+            counts = self.value_counts[column].add(chunk[column].value_counts(), fill_value=0).astype(np.int64)
+            if len(counts) > 2 * self.max_categories:
+                # High-cardinality columns such as IDs would otherwise keep growing, so only the most frequent values
+                # are kept; a value dropped here that comes back later is undercounted
+                counts = counts.nlargest(self.max_categories)
+                if column not in self.truncated_columns:
+                    self.truncated_columns.append(column)
+            self.value_counts[column] = counts
+
+        self._update_sample(chunk)
+        self.rows += len(chunk)
+
+    def _classify(self, columns):
+        """
+          Start accumulating statistics for columns based on their dtype; columns that are neither numeric nor
+          categorical (such as datetimes) only contribute to the null counts, the same as with DataFrame.describe()
+        """
+        numeric = [column for column in columns if _is_numeric_dtype(self._undecided[column])]
+        categorical = [column for column in columns if column not in numeric and
+                       (pd.api.types.is_object_dtype(self._undecided[column]) or pd.api.types.is_string_dtype(self._undecided[column]))]
+
+        self.numeric_columns += numeric
+        self.moments.add_columns(len(numeric))
+        self.sketches.update({column: _QuantileSketch(random_state=self.random_state) for column in numeric})
+
+        self.categorical_columns += categorical
+        self.value_counts.update({column: pd.Series(dtype=np.int64) for column in categorical})
+
+        for column in columns:
+            del self._undecided[column]
+
+    def _finish(self):
+        """
+          Classify the columns that were null in every chunk by the dtype they ended with, and sort the value counts
+          with the most frequent values first, keeping at most max_categories of them
+        """
+        self._classify(list(self._undecided))
+        for column, counts in self.value_counts.items():
+            if len(counts) > self.max_categories and column not in self.truncated_columns:
+                self.truncated_columns.append(column)
+            self.value_counts[column] = counts.sort_values(ascending=False, kind='stable').iloc[:self.max_categories]
+
+    def _update_sample(self, chunk):
+        # Bottom-k sampling: every row draws a random key and the rows with the smallest keys form the sample
+        keys = self._rng.random(len(chunk))
+        if len(self._sample_keys) >= self.sample_size:
+            candidates = np.flatnonzero(keys < self._sample_keys.max())
+        else:
+            candidates = np.arange(len(chunk))
+
+        if len(candidates) == 0:
+            return
+
+        new_rows = chunk.iloc[candidates]
+        combined = new_rows if self.sample is None else pd.concat([self.sample, new_rows])
+        combined_keys = np.concatenate([self._sample_keys, keys[candidates]])
+        combined_rows = np.concatenate([self._sample_rows, self.rows + candidates])
+
+        if len(combined_keys) > self.sample_size:
+            keep = np.argpartition(combined_keys, self.sample_size - 1)[:self.sample_size]
+        else:
+            keep = np.arange(len(combined_keys))
+        # Keep the sample in the same order as the source rows
+        keep = keep[np.argsort(combined_rows[keep])]
+
+        self.sample = combined.iloc[keep]
+        self._sample_keys = combined_keys[keep]
+        self._sample_rows = combined_rows[keep]
+
+    def summary(self):
+        """
+          The same statistics as DataFrame.describe() for the numeric columns; quartiles are approximate
+        """
+        self._finish()
+        quartiles = np.array([self.sketches[column].quantile([0.25, 0.5, 0.75]) for column in self.numeric_columns]).reshape(-1, 3)
+        moments = self.moments
+        has_values = moments.count > 0
+        summary = pd.DataFrame(
+            [moments.count,
+             np.where(has_values, moments.mean, np.nan),
+             moments.std,
+             np.where(has_values, moments.min, np.nan),
+             quartiles[:, 0], quartiles[:, 1], quartiles[:, 2],
+             np.where(has_values, moments.max, np.nan)],
+            index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+            columns=self.numeric_columns,
+        )
+        # Columns are classified in the order values show up, so put them back in source order
+        return summary[[column for column in self.columns if column in summary.columns]]
+
+    def null_percentages(self):
+        """
+          Column-wise null percentages in the same format as EDA.check_null
+        """
+        if self.null_counts.sum() == 0:
+            return "No null values"
+        return {column: f'{round(100 * count / self.rows, 2)}%' for column, count in self.null_counts.items()}
+
+    def outlier_bounds(self):
+        """
+          Lower and upper 1.5 * IQR outlier bounds for each numeric column
+        """
+        self._finish()
+        return _sketch_bounds(self.sketches, self.numeric_columns, 1.5)
+
+
+def _mode(data):
+    modes = data.mode(dropna=True)
+    return pd.Series({column: modes[column].iloc[0] if len(modes) else np.nan for column in data.columns}, dtype=object)
+
+
+# The dtypes select_dtypes treats as categorical; 'string' picks up the str dtype of pandas 3 as well as the
+# StringDtype of pandas 2, which 'object' alone will stop selecting in pandas 4
+_CATEGORICAL_DTYPES = ['object', 'category', 'string']
+
+
+# Per-column statistics available through EDA._stats; each takes a DataFrame and returns a Series indexed by column
+_COLUMN_STATS = {
+    'mean': lambda data: data.mean(),
+    'std': lambda data: data.std(),
+    'median': lambda data: data.median(),
+    'mode': _mode,
+}
+
+
+def _smallest_int_dtype(n_codes):
+    """
+      The smallest signed integer dtype that holds the codes 0 to n_codes - 1 as well as -1
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_codes - 1 <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+class CategoricalEncoder():
+    """
+      Encodes categorical columns with compact integer labels and remembers the labels of every column, so that
+      new batches of data can be encoded without refitting
+
+      Labels are numbered in order of first appearance, null values get a label of their own, and values that
+      were not seen during fitting are encoded as -1
+    """
+    def __init__(self):
+        self.mappings = {}
+
+    def fit(self, data, columns=None):
+        """
+          Learn the labels of each column
+
+          Args:
+            data (pd.DataFrame): The data to learn the labels from
+            columns (list, optional, defaults to None): The columns to encode; if None, every object, string and category column is used
+
+        """
+        self.fit_transform(data, columns)
+        return self
+
+    def fit_transform(self, data, columns=None):
+        """
+          Learn the labels of each column and return the encoded columns as a DataFrame
+
+          Args:
+            data (pd.DataFrame): The data to learn the labels from
+            columns (list, optional, defaults to None): The columns to encode; if None, every object, string and category column is used
+
+        """
+        if columns is None:
+            columns = data.select_dtypes(include=_CATEGORICAL_DTYPES).columns
+
+        encoded = {}
+        for column in columns:
+            codes, uniques = pd.factorize(data[column], use_na_sentinel=False)
+            self.mappings[column] = pd.Index(uniques)
+            encoded[column] = codes.astype(_smallest_int_dtype(len(uniques)), copy=False)
+        return pd.DataFrame(encoded, index=data.index, columns=list(columns))
+
+    def transform(self, data):
+        """
+          Encode the fitted columns of data with the labels learned during fitting; unseen values become -1
+
+          Args:
+            data (pd.DataFrame): The data to encode; it must contain every fitted column
+
+        """
+        assert all(column in data.columns for column in self.mappings), 'Data is missing one or more of the encoded columns'
+
+        encoded = {}
+        for column, uniques in self.mappings.items():
+            codes = uniques.get_indexer(data[column])
+            if uniques.hasnans:
+                # Null values are matched by position since None and NaN do not compare equal
+                codes[data[column].isna().to_numpy()] = np.flatnonzero(uniques.isna())[0]
+            encoded[column] = codes.astype(_smallest_int_dtype(len(uniques)), copy=False)
+        return pd.DataFrame(encoded, index=data.index)
+
+    def inverse_transform(self, data):
+        """
+          Map encoded columns back to their original values; -1 becomes a null value
+
+          Args:
+            data (pd.DataFrame): Data containing encoded columns
+
+        """
+        decoded = {}
+        for column, uniques in self.mappings.items():
+            if column in data.columns:
+                # The extra null at the end of the lookup table is what a code of -1 picks up
+                lookup = np.append(np.asarray(uniques, dtype=object), np.nan)
+                decoded[column] = lookup[np.asarray(data[column])]
+        return pd.DataFrame(decoded, index=data.index)
+
+    def mapping(self, column):
+        """
+          The labels of a fitted column as a {value: code} dictionary
+        """
+        return {value: code for code, value in enumerate(self.mappings[column])}
+
+
+class Scaler():
+    """
+      Scales numeric columns with parameters that are fitted once and kept, so they can be applied to later
+      batches or inverted
+
+      Column moments are accumulated with a mergeable one-pass update over row chunks, so fitting never holds
+      more than one chunk of temporaries and the scaler can also be fitted incrementally with partial_fit
+
+      Parameters:
+        method (str, optional, defaults to 'StandardScaler'): Either StandardScaler or MinMaxScaler
+        chunksize (int, optional, defaults to 65,536): The number of rows folded into the moments at a time
+    """
+    def __init__(self, method='StandardScaler', chunksize=65_536):
+        assert method in ('StandardScaler', 'MinMaxScaler'), 'method must be either StandardScaler or MinMaxScaler'
+        self.method = method
+        self.chunksize = chunksize
+        self.columns = None
+        self.moments = None
+        self.offset = None
+        self.scale = None
+
+    def partial_fit(self, data):
+        """
+          Fold a batch of numeric data into the fitted parameters
+
+          Args:
+            data (pd.DataFrame): A batch of data containing only numeric columns; every batch must have the same columns
+
+        """
+        if self.columns is None:
+            self.columns = data.columns
+            self.moments = _Moments(len(self.columns))
+        assert list(data.columns) == list(self.columns), 'Every batch must have the same columns'
+
+        for start in range(0, len(data), self.chunksize):
+            self.moments.update(data.iloc[start:start + self.chunksize].to_numpy(dtype=float, na_value=np.nan))
+
+        if self.method == 'StandardScaler':
+            self.offset, self.scale = self.moments.mean, self.moments.std
+        else:
+            self.offset, self.scale = self.moments.min, self.moments.max - self.moments.min
+        # Constant columns are only shifted instead of being divided by zero
+        self.scale = np.where((self.scale == 0) | np.isnan(self.scale), 1.0, self.scale)
+        return self
+
+    def fit(self, data):
+        """
+          Fit the parameters on data, discarding anything fitted before
+
+          Args:
+            data (pd.DataFrame): Data containing only numeric columns
+
+        """
+        self.columns = None
+        return self.partial_fit(data)
+
+    def transform(self, data, dtype=np.float64):
+        """
+          Scale the fitted columns of data and return them as a new DataFrame
+
+          Args:
+            data (pd.DataFrame): Data containing every fitted column
+            dtype (numpy dtype, optional, defaults to np.float64): The dtype of the result; np.float32 halves memory use
+
+        """
+        return pd.DataFrame({column: self.transform_column(data, column, dtype) for column in self.columns}, index=data.index)
+
+    def transform_column(self, data, column, dtype=np.float64):
+        """
+          Scale one fitted column of data and return it as a numpy array, so callers can replace columns one at a
+          time and only ever hold one extra column in memory
+
+          Args:
+            data (pd.DataFrame): Data containing the column
+            column (str): The fitted column to scale
+            dtype (numpy dtype, optional, defaults to np.float64): The dtype of the result; np.float32 halves memory use
+
+        """
+        i = self.columns.get_loc(column)
+        # Scaled in place on a private copy of the column
+        values = data[column].to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+        values -= dtype(self.offset[i])
+        values /= dtype(self.scale[i])
+        return values
+
+    def inverse_transform(self, data, dtype=np.float64):
+        """
+          Undo the scaling of the fitted columns of data and return them as a new DataFrame
+
+          Args:
+            data (pd.DataFrame): Scaled data containing every fitted column
+            dtype (numpy dtype, optional, defaults to np.float64): The dtype of the result
+
+        """
+        unscaled = {}
+        for i, column in enumerate(self.columns):
+            values = data[column].to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+            values *= dtype(self.scale[i])
+            values += dtype(self.offset[i])
+            unscaled[column] = values
+        return pd.DataFrame(unscaled, index=data.index)
+
+
+def _iqr_bounds(Q1, Q3, whisker):
+    """
+      Lower and upper outlier bounds from arrays of first and third quartiles
+    """
+    IQR = Q3 - Q1
+    return Q1 - IQR * whisker, Q3 + IQR * whisker
+
+
+def _sketch_bounds(sketches, columns, whisker):
+    """
+      {column: (lower, upper)} outlier bounds from the quartiles of a dictionary of _QuantileSketch objects
+    """
+    quartiles = np.array([sketches[column].quantile([0.25, 0.75]) for column in columns]).reshape(-1, 2)
+    lower, upper = _iqr_bounds(quartiles[:, 0], quartiles[:, 1], whisker)
+    return {column: (float(lower[i]), float(upper[i])) for i, column in enumerate(columns)}
+
+
+def _find_outliers(data, lower, upper):
+    """
+      Compare every numeric column of data against its bounds in one vectorized pass and return the outlier
+      count and row positions of each column
+    """
+    block = data.to_numpy(dtype=float, na_value=np.nan)
+    mask = (block < lower) | (block > upper)
+    index_dtype = np.int32 if len(block) <= np.iinfo(np.int32).max else np.int64
+
+    results = {}
+    for i, column in enumerate(data.columns):
+        indices = np.flatnonzero(mask[:, i]).astype(index_dtype, copy=False)
+        results[column] = {'lower': float(lower[i]), 'upper': float(upper[i]), 'count': len(indices), 'indices': indices}
+    return results
+
+
+class OutlierDetector():
+    """
+      Finds outliers with bounds from approximate quartiles, which are kept in mergeable quantile sketches so the
+      bounds can be maintained over streamed chunks of data
+
+      Parameters:
+        whisker (float, optional, defaults to 1.5): How many IQRs beyond the quartiles a value has to be to count as an outlier
+        k (int, optional, defaults to 1024): Capacity of each sketch level; larger values give more accurate bounds
+        random_state (int, optional, defaults to 0): Seed for the sketches
+    """
+    def __init__(self, whisker=1.5, k=1024, random_state=0):
+        self.whisker = whisker
+        self.k = k
+        self.random_state = random_state
+        self.columns = None
+        self.sketches = {}
+
+    def partial_fit(self, data):
+        """
+          Fold a chunk of data into the quartile sketches of its numeric columns
+
+          Args:
+            data (pd.DataFrame): A chunk of data; every chunk must have the same numeric columns
+
+        """
+        if self.columns is None:
+            # The numeric columns are picked from the first chunk only
+            self.columns = data.select_dtypes(include=np.number).columns
+            self.sketches = {column: _QuantileSketch(k=self.k, random_state=self.random_state) for column in self.columns}
+
+        numeric = data if data.columns.equals(self.columns) else data[self.columns]
+        block = numeric.to_numpy(dtype=float, na_value=np.nan)
+        for i, column in enumerate(self.columns):
+            self.sketches[column].update(block[:, i])
+        return self
+
+    def merge(self, other):
+        """
+          Combine the sketches of another OutlierDetector fitted on different rows of the same columns
+        """
+        if self.columns is None:
+            self.columns = other.columns
+            self.sketches = {column: _QuantileSketch(k=self.k, random_state=self.random_state) for column in self.columns}
+        for column in self.columns:
+            self.sketches[column].merge(other.sketches[column])
+        return self
+
+    def bounds(self):
+        """
+          The current {column: (lower, upper)} outlier bounds
+        """
+        return _sketch_bounds(self.sketches, self.columns, self.whisker)
+
+    def detect(self, data):
+        """
+          Find the outliers of a chunk of data using the current bounds
+
+          Args:
+            data (pd.DataFrame): Data containing every fitted column
+
+          Returns:
+            dict mapping each column to a dict with its lower and upper bounds, number of outliers and outlier row positions
+        """
+        bounds = self.bounds()
+        lower = np.array([bounds[column][0] for column in self.columns])
+        upper = np.array([bounds[column][1] for column in self.columns])
+        return _find_outliers(data[self.columns], lower, upper)
+
+
+def _standardized_block(data, method):
+    """
+      Turn numeric columns into a float32 block whose column dot products are their correlations; null values
+      end up as zeros, which is the same as replacing them with the column mean
+    """
+    if method == 'spearman':
+        data = data.rank()
+    block = data.to_numpy(dtype=np.float32, na_value=np.nan, copy=True)
+    block -= np.nanmean(block, axis=0)
+    np.nan_to_num(block, copy=False, nan=0.0)
+    norms = np.sqrt(np.einsum('ij,ij->j', block, block))
+    # Constant columns have no correlation with anything
+    block /= np.where(norms > 0, norms, np.inf)
+    return block
+
+
+def _correlation_pairs(block, columns, top_k, threshold, block_size, workers):
+    """
+      Compute the correlations of a standardized block tile by tile across a thread pool, keeping only the pairs
+      above threshold and/or the top_k strongest pairs of each tile before they are merged
+    """
+    n_columns = block.shape[1]
+    starts = range(0, n_columns, block_size)
+    tiles = [(i, j) for i in starts for j in starts if j >= i]
+
+    def tile_pairs(tile):
+        i, j = tile
+        corr = block[:, i:i + block_size].T @ block[:, j:j + block_size]
+        rows, cols = np.nonzero(np.ones(corr.shape, dtype=bool) if threshold is None else np.abs(corr) >= threshold)
+        # Only the upper triangle of the full matrix, without the diagonal
+        keep = i + rows < j + cols
+        rows, cols = rows[keep], cols[keep]
+        values = corr[rows, cols]
+        if top_k is not None and len(values) > top_k:
+            strongest = np.argpartition(-np.abs(values), top_k - 1)[:top_k]
+            rows, cols, values = rows[strongest], cols[strongest], values[strongest]
+        return i + rows, j + cols, values
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(tile_pairs, tiles))
+
+    first = np.concatenate([result[0] for result in results]) if results else np.empty(0, dtype=int)
+    second = np.concatenate([result[1] for result in results]) if results else np.empty(0, dtype=int)
+    values = np.concatenate([result[2] for result in results]) if results else np.empty(0, dtype=np.float32)
+
+    order = np.argsort(-np.abs(values), kind='stable')
+    if top_k is not None:
+        order = order[:top_k]
+    return pd.DataFrame({
+        'column_1': columns[first[order]],
+        'column_2': columns[second[order]],
+        'correlation': values[order],
+    })
+
+
+def _kde_bandwidth(rule, count, std, IQR):
+    """
+      Kernel bandwidth from Scott's or Silverman's rule of thumb
+    """
+    assert rule in ('scott', 'silverman'), 'bandwidth must be scott, silverman or a number'
+    if count == 0:
+        # There is nothing to smooth, and count ** (-1 / 5) would divide by zero
+        return 1.0
+    if rule == 'scott':
+        h = 1.059 * std * count ** (-1 / 5)
+    else:
+        spread = min(std, IQR / 1.349) if IQR > 0 else std
+        h = 0.9 * spread * count ** (-1 / 5)
+    # A constant column still needs a positive bandwidth
+    return h if h > 0 else 1.0
+
+
+def _binned_kde(values, h, grid_size):
+    """
+      Gaussian kernel density of values on an evenly spaced grid, using histogram binning and FFT convolution
+    """
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return np.empty(0), np.empty(0)
+
+    # The grid reaches 3 bandwidths past the data so the tails are not cut off
+    low, high = values.min() - 3 * h, values.max() + 3 * h
+    counts, edges = np.histogram(values, bins=grid_size, range=(low, high))
+    grid = (edges[:-1] + edges[1:]) / 2
+    dx = edges[1] - edges[0]
+
+    # The kernel is truncated at 4 bandwidths (or the grid width, whichever is smaller)
+    half_width = min(int(np.ceil(4 * h / dx)), grid_size)
+    offsets = np.arange(-half_width, half_width + 1) * dx
+    kernel = np.exp(-0.5 * (offsets / h) ** 2) / (h * np.sqrt(2 * np.pi))
+
+    size = 1 << int(np.ceil(np.log2(grid_size + len(kernel) - 1)))
+    smoothed = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+    density = smoothed[half_width:half_width + grid_size] / len(values)
+    return grid, np.clip(density, 0, None)
+
+
+# The shared numeric block of the current worker process, set by _init_shared_worker
+_worker_block = None
+_worker_shared = None
+
+
+@contextmanager
+def _shared_block(data):
+    """
+      Copy the columns of a numeric DataFrame into a column-major float64 shared memory block, so each worker
+      reads contiguous columns, and yield the (name, shape) that workers need to map it; the block is unlinked on exit
+    """
+    shape = (len(data), len(data.columns))
+    shared = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shared.buf, order='F')
+        # One column at a time, so the only temporary is a single column rather than a float copy of the whole frame
+        for j in range(shape[1]):
+            block[:, j] = data.iloc[:, j].to_numpy(dtype=float, na_value=np.nan)
+        del block
+        yield shared.name, shape
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def _init_shared_worker(name, shape):
+    """
+      Process pool initializer that maps the shared numeric block once per worker
+    """
+    global _worker_block, _worker_shared
+    # Workers share the parent's resource tracker, so attaching does not take over ownership of the block
+    _worker_shared = shared_memory.SharedMemory(name=name)
+    _worker_block = np.ndarray(shape, dtype=np.float64, buffer=_worker_shared.buf, order='F')
+
+
+def _init_render_worker(name, shape):
+    """
+      Process pool initializer for render_report that maps the shared numeric block and selects the Agg backend
+    """
+    plt.switch_backend('Agg')
+    _init_shared_worker(name, shape)
+
+
+def _profile_numeric(block, whisker=1.5):
+    """
+      describe()-style statistics, null counts, outlier bounds and cardinalities of a 2D float block, column by column
+    """
+    with warnings.catch_warnings():
+        # All-null columns give NaN statistics, which is what describe() reports as well
+        warnings.simplefilter('ignore', RuntimeWarning)
+        count = np.count_nonzero(~np.isnan(block), axis=0)
+        Q1, median, Q3 = np.nanpercentile(block, [25, 50, 75], axis=0)
+        stats = {
+            'count': count.astype(float),
+            'mean': np.nanmean(block, axis=0),
+            'std': np.nanstd(block, axis=0, ddof=1),
+            'min': np.nanmin(block, axis=0),
+            '25%': Q1, '50%': median, '75%': Q3,
+            'max': np.nanmax(block, axis=0),
+        }
+    lower, upper = _iqr_bounds(Q1, Q3, whisker)
+    cardinality = np.array([len(np.unique(column[~np.isnan(column)])) for column in block.T])
+    return stats, len(block) - count, lower, upper, cardinality
+
+
+def _profile_worker(columns):
+    """
+      Profile a (start, stop) range of columns of the shared numeric block
+    """
+    start, stop = columns
+    return _profile_numeric(_worker_block[:, start:stop])
+
+
+def _profile_categorical(data):
+    """
+      Null counts and cardinalities of a DataFrame of categorical columns
+    """
+    return data.isna().sum(), data.nunique()
+
+
+def _render_plot(task):
+    """
+      Draw one plot of one column into a file and return its path
+    """
+    plot, column, index, path, options = task
+    fig, ax = plt.subplots()
+
+    if plot == 'bar':
+        counts = options['counts']
+        ax.bar(counts.index.astype(str), counts.to_numpy())
+        ax.set_ylabel('count')
+    else:
+        values = _worker_block[:, index]
+        values = values[np.isfinite(values)]
+        if plot == 'hist':
+            counts, edges = np.histogram(values, bins=options['bins'])
+            ax.stairs(counts, edges, fill=True)
+        elif plot == 'density':
+            if len(values):
+                h = _kde_bandwidth('scott', len(values), values.std(ddof=1) if len(values) > 1 else 0.0, 0.0)
+                grid, density = _binned_kde(values, h, options['grid_size'])
+                ax.plot(grid, density)
+            ax.set_ylabel('Density')
+        else:
+            ax.boxplot(values)
+
+    ax.set_xlabel(column)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+    return path
+
+
+def _instrumented(method):
+    """
+      Decorator for public EDA methods that records the call in self.instrumentation when instrumentation is on
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.instrument:
+            return method(self, *args, **kwargs)
+        return self._run_instrumented(method, args, kwargs)
+    return wrapper
+
 
 class EDA():
     """
@@ -10,32 +925,240 @@ class EDA():
       Parameters:
         data (pd.DataFrame): The dataset that EDA will be performed on
         autologger (boolean, optional, defaults to True): If True, then important information regarding the dataset will automatically be recorded as certain methods are used
+        optimize_memory (boolean, optional, defaults to False): If True, then EDA.optimize_memory is run on the data right away
+        instrument (boolean, optional, defaults to False): If True, then every public method call is timed and recorded in self.instrumentation (see EDA.instrumentation_report)
+        trace_memory (boolean, optional, defaults to True): If True and instrument is True, then the peak memory of each call is measured with tracemalloc, which slows calls down. If tracemalloc is already tracing (for example because the caller is measuring memory itself), then no peak is recorded so the caller's own peak is left alone
 
       """
-    def __init__(self, data, autologger=True):
+    def __init__(self, data, autologger=True, optimize_memory=False, instrument=False, trace_memory=True):
         # Ensure that the input 'data' is a pandas DataFrame
         assert isinstance(data, pd.DataFrame), 'Data must be a dataframe object'
 
-        # Initialize the class with the given DataFrame and store a copy of the original data
-        self.data = data
+        # Opt-in per-call timing and memory records
+        self.instrument = instrument
+        self.trace_memory = trace_memory
+        self.instrumentation = []
+        self._instrument_stack = []
+
+        # Statistics are computed lazily and cached until the data version changes
+        self._version = 0
+        self._cache = {}
+        self._cache_version = 0
+
+        # Initialize the class with a shallow copy of the given DataFrame and keep the given DataFrame as the original.
+        # Methods of this class replace columns instead of writing into them, so the two share every column until
+        # it is changed and only the changed columns are ever copied. This relies on column assignment replacing the
+        # column rather than writing into the shared array, which pandas guarantees from 2.0 on (and copy-on-write
+        # enforces in pandas 3)
+        self.data = data.copy(deep=False)
         self.data_original = data
 
-        # Extract column names, numeric, and categorical columns
-        self.columns = data.columns
-        self.numeric = data.select_dtypes(include=np.number)
-        self.categorical = data.select_dtypes(include='object')
-
         # Create a logger dictionary to track the number of rows, columns, and other useful information
         self.logger = {'Number of Rows': data.shape[0], 'Number of Columns:': data.shape[1]}
         self.autologger = autologger
 
-        # Calculate summary statistics for data
-        self.summary = data.describe()
+        # Set by encode and scaling
+        self.encoder = None
+        self.scaler = None
+
+        # Only set by the streaming constructors, where self.data is a sample of the full source
+        self.streamed = False
+        self.source_summary = None
+        self.null_percentages = None
+        self.outlier_bounds = None
+        self.value_counts = None
+        self._source_null_counts = None
+        self._source_rows = None
+        self._source_version = None
+
+        if optimize_memory:
+            self.optimize_memory()
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        # Replacing the DataFrame always counts as a mutation
+        self._data = value
+        self._data_changed()
+
+    @property
+    def columns(self):
+        return self.data.columns
+
+    @property
+    def numeric(self):
+        """
+          The numeric columns of the data, recomputed only after the data changes
+        """
+        return self._cached('numeric', lambda: self.data.select_dtypes(include=np.number))
+
+    @property
+    def categorical(self):
+        """
+          The categorical columns of the data, recomputed only after the data changes
+        """
+        return self._cached('categorical', lambda: self.data.select_dtypes(include=_CATEGORICAL_DTYPES))
+
+    @property
+    def summary(self):
+        """
+          Summary statistics for the data, recomputed only after the data changes
+
+          On an instance built by a streaming constructor this is the summary of the full source (self.source_summary)
+          until the data is first changed, and the summary of the changed sample after that
+        """
+        if self._describes_source():
+            return self.source_summary
+        return self._cached('summary', self.data.describe)
+
+    @summary.setter
+    def summary(self, value):
+        self._current_cache()['summary'] = value
+
+    def _data_changed(self):
+        """
+          Helper method that bumps the data version so every cached statistic is recomputed on its next use;
+          every method that mutates self.data in place must call it
+        """
+        self._version += 1
+
+    def _describes_source(self):
+        """
+          Helper method that tells whether the full-source statistics of a streamed instance still apply, which is
+          the case until self.data is first changed
+        """
+        return self.streamed and self._version == self._source_version
 
-    def hist(self, all=False, variables=None, num_histograms=None, n_rows=None, n_columns=None, size=12):
+    def _current_cache(self):
+        """
+          Helper method that returns the statistics cache, emptying it first if the data has changed since it was filled
+        """
+        if self._cache_version != self._version:
+            self._cache = {}
+            self._cache_version = self._version
+        return self._cache
+
+    def _cached(self, key, compute):
+        """
+          Helper method that returns the cached value for key, calling compute() to fill it on a miss
+        """
+        cache = self._current_cache()
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+    def _stats(self, name, columns):
+        """
+          Helper method that returns a per-column statistic (see _COLUMN_STATS) as a Series indexed by columns
+
+          Columns that are not cached yet are computed together in one vectorized call and cached individually,
+          so different methods asking for overlapping columns share the work
+        """
+        cache = self._current_cache()
+        columns = list(columns)
+        missing = [column for column in columns if (name, column) not in cache]
+        if missing:
+            values = _COLUMN_STATS[name](self.data[missing])
+            for column in missing:
+                cache[(name, column)] = values[column]
+        return pd.Series({column: cache[(name, column)] for column in columns}, dtype=object if name == 'mode' else None)
+
+    @classmethod
+    def from_csv_chunks(cls, path, chunksize=1_000_000, sample_size=100_000, autologger=True, random_state=0, max_categories=10_000, **read_csv_kwargs):
+        """
+          Create an EDA instance from a CSV file that is too large to fit in memory by reading it in row chunks
+
+          The summary, null percentages, outlier bounds and categorical value counts are computed over every row of
+          the file with one-pass accumulators, so peak memory stays at about one chunk. self.data holds a uniform
+          random sample of at most sample_size rows, which the plotting and cleaning methods work on. Until self.data
+          is first changed, summary, check_null and remove_null use the full-source figures; the full-source summary
+          stays available as self.source_summary afterwards
+
+          read_csv infers dtypes per chunk, so a column is classified as numeric or categorical by the first chunk
+          that has a value in it. Non-numeric values that show up later in a numeric column are treated as null
+          with a warning; pass dtype= to set the column types explicitly
+
+          Args:
+            path (str): Path to the CSV file
+            chunksize (int, optional, defaults to 1,000,000): The number of rows read at a time
+            sample_size (int, optional, defaults to 100,000): The maximum number of rows kept in self.data
+            autologger (boolean, optional, defaults to True): Same as in EDA.__init__
+            random_state (int, optional, defaults to 0): Seed for the row sample and the approximate quartiles
+            max_categories (int, optional, defaults to 10,000): The most distinct values whose counts are kept in self.value_counts for each categorical column; columns with more (such as IDs) only keep the most frequent values, and those counts can be undercounts
+            **read_csv_kwargs: Passed through to pd.read_csv (for example dtype or usecols)
+
+        """
+        return cls._from_chunks(pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs), sample_size, autologger, random_state, max_categories)
+
+    @classmethod
+    def from_parquet(cls, path, batch_size=1_000_000, sample_size=100_000, autologger=True, random_state=0, columns=None, max_categories=10_000):
+        """
+          Create an EDA instance from a Parquet file that is too large to fit in memory by reading it in row batches
+
+          Works the same way as EDA.from_csv_chunks and requires pyarrow
+
+          Args:
+            path (str): Path to the Parquet file
+            batch_size (int, optional, defaults to 1,000,000): The number of rows read at a time
+            sample_size (int, optional, defaults to 100,000): The maximum number of rows kept in self.data
+            autologger (boolean, optional, defaults to True): Same as in EDA.__init__
+            random_state (int, optional, defaults to 0): Seed for the row sample and the approximate quartiles
+            columns (list, optional, defaults to None): If not none, only these columns are read
+            max_categories (int, optional, defaults to 10,000): Same as in EDA.from_csv_chunks
+
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError('EDA.from_parquet requires pyarrow; install it with "pip install pyarrow"') from error
+
+        batches = pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns)
+        return cls._from_chunks((batch.to_pandas() for batch in batches), sample_size, autologger, random_state, max_categories)
+
+    @classmethod
+    def _from_chunks(cls, chunks, sample_size, autologger, random_state, max_categories):
+        """
+          Helper method that consumes an iterable of DataFrame chunks and builds a streamed EDA instance
+        """
+        accumulator = _ChunkAccumulator(sample_size, random_state=random_state, max_categories=max_categories)
+        for chunk in chunks:
+            accumulator.update(chunk)
+
+        assert accumulator.columns is not None, 'The data source did not contain any rows'
+
+        eda = cls(accumulator.sample.reset_index(drop=True), autologger=autologger)
+        eda.streamed = True
+        # Kept outside the statistics cache, so changing the data does not lose the full-source figures
+        eda.source_summary = accumulator.summary()
+        eda.null_percentages = accumulator.null_percentages()
+        eda.outlier_bounds = accumulator.outlier_bounds()
+        eda.value_counts = accumulator.value_counts
+        eda._source_null_counts = accumulator.null_counts
+        eda._source_rows = accumulator.rows
+        eda._source_version = eda._version
+
+        # The logger describes the full source, not the sample
+        eda.logger['Number of Rows'] = accumulator.rows
+        eda.logger['Number of Sampled Rows'] = len(eda.data)
+        if autologger:
+            eda.change_log('Null percentages', eda.null_percentages)
+            eda.change_log('Outlier bounds', eda.outlier_bounds)
+            if accumulator.truncated_columns:
+                eda.change_log('Columns with truncated value counts', accumulator.truncated_columns)
+
+        return eda
+
+    @_instrumented
+    def hist(self, all=False, variables=None, num_histograms=None, n_rows=None, n_columns=None, size=12, bins=10):
       """
         Generates historgrams based on the features in the dataset
 
+        The bars are drawn from bin counts computed once per column by EDA.histogram, so rendering time depends on
+        the number of bins rather than the number of rows
+
         Args:
           all (boolean, optional, defaults to False): If True, then a histogram of every single value will be displayed
           variables (list, optional, defaults to None): If not none, then a histogram of any column/feature in variables(and the data) will be generated; num_histograms must be null if variables is not
@@ -43,43 +1166,80 @@ class EDA():
           n_rows (int, optional, defaults to None): If not none, then it is the number of rows that the display of the histograms will take up;
           n_cols (int, optional, defaults to None): If not none, then it is the number of columns that the display of the histograms will take up; n_rows * n_columns should be greater than or equal to the number of histograms desired
           size (int, optional, defaults to 12): Controls how big or small the display of the historgrams will be
+          bins (int, optional, defaults to 10): The number of bins in each histogram
 
       """
-        # Plot histograms for all numeric columns
-      if all:
-        return self.data.hist(figsize=(size, size))
+      if variables is not None and num_histograms is not None:
+        return "You provided values for both variables and num_histograms. Note that num_histograms should only be provided if you want the first n histograms in the dataframe to be created. If you did intend this effect, then no value for the variable parameter should be passed. Similarly, if you wanted to to create a histogram of specific variables only, then you do not need to give a value for the num_histograms parameter."
+      columns = self.numeric.columns
+      n_cols = n_columns
 
-        if variables is not None and num_histograms is not None:
-          return "You provided values for both variables and num_histograms. Note that num_histograms should only be provided if you want the first n histograms in the dataframe to be created. If you did intend this effect, then no value for the variable parameter should be passed. Similarly, if you wanted to to create a histogram of specific variables only, then you do not need to give a value for the num_histograms parameter."
-        columns = self.numeric.columns
+      # Plot histograms for all numeric columns
+      if all:
+        with self._phase('render'):
+          plt.figure(figsize=(size, size))
+        variables = list(columns)
+      elif num_histograms is not None:
+        variables = list(columns[:num_histograms])
 
-        if self.autologger:
-          logged_columns = []
+      if self.autologger:
+        logged_columns = []
 
-        if variables is not None:
-          i = 1
-          num_box = len(variables) if variables is None else len(variables)
+      if variables is not None:
+        i = 1
+        num_box = len(variables) if variables is None else len(variables)
 
-          if n_rows is None or n_cols is None:
-            n_rows = int(num_box ** 0.5)
-            n_cols = int(num_box / n_rows) + 1
+        if n_rows is None or n_cols is None:
+          n_rows = int(num_box ** 0.5)
+          n_cols = int(num_box / n_rows) + 1
 
-          for var in variables:
-            if var not in self.numeric.columns:
-              print(f'{var} is not a part of the dataset or is a categorical variable, so no histogram will be created for it')
-            else:
-              plt.subplot(n_rows, len(variables), i)
-              plt.hist(self.data[var])
-              plt.xlabel(columns[i])
-              if self.autologger:
-                logged_columns.append(var)
-              i += 1
+        for var in variables:
+          if var not in self.numeric.columns:
+            print(f'{var} is not a part of the dataset or is a categorical variable, so no histogram will be created for it')
+          else:
+            with self._phase('compute'):
+              counts, edges = self.histogram(var, bins=bins)
+            with self._phase('render'):
+              plt.subplot(n_rows, n_cols, i)
+              plt.stairs(counts, edges, fill=True)
+              plt.xlabel(var)
+            if self.autologger:
+              logged_columns.append(var)
+            i += 1
 
+        with self._phase('render'):
           plt.tight_layout()
 
-    def density(self, all=False, variables=None, num_dense=None, n_rows=None, n_columns=None, size=12):
+      if all:
+        return plt.gcf().axes
+
+    @_instrumented
+    def histogram(self, column, bins=10):
+      """
+        Bin counts of a numeric column, computed with np.histogram and cached until the data changes
+
+        Args:
+          column (str): The numeric column
+          bins (int, optional, defaults to 10): The number of bins
+
+        Returns:
+          (counts, bin edges) tuple of numpy arrays
+      """
+      assert column in self.numeric.columns, f'{column} is not a numeric column in the dataset'
+
+      def compute():
+        values = self.data[column].to_numpy(dtype=float, na_value=np.nan)
+        return np.histogram(values[np.isfinite(values)], bins=bins)
+
+      return self._cached(('histogram', column, bins), compute)
+
+    @_instrumented
+    def density(self, all=False, variables=None, num_dense=None, n_rows=None, n_columns=None, size=12, grid_size=512, bandwidth='scott'):
         """
-          Generates historgrams based on the features in the dataset
+          Generates density plots based on the features in the dataset
+
+          The densities come from EDA.kde, which bins each column onto a grid and smooths it with an FFT, so the
+          cost does not grow with the number of points the kernel is evaluated against
 
           Args:
             all (boolean, optional, defaults to False): If True, then a density plot of every single value will be displayed
@@ -88,15 +1248,31 @@ class EDA():
             n_rows (int, optional, defaults to None): If not none, then it is the number of rows that the display of the density plots will take up;
             n_cols (int, optional, defaults to None): If not none, then it is the number of columns that the display of the density plots will take up; n_rows * n_columns should be greater than or equal to the number of density plots desired
             size (int, optional, defaults to 12): Controls how big or small the display of the density plots will be
+            grid_size (int, optional, defaults to 512): The number of grid points each density is estimated on
+            bandwidth (str or float, optional, defaults to 'scott'): Either scott, silverman or a fixed kernel bandwidth
 
         """
 
         if all:
-          return self.data.plot.density(figsize=(size, size))
+          with self._phase('render'):
+            fig, ax = plt.subplots(figsize=(size, size))
+          for column in self.numeric.columns:
+            with self._phase('compute'):
+              grid, values = self.kde(column, grid_size=grid_size, bandwidth=bandwidth)
+            with self._phase('render'):
+              ax.plot(grid, values, label=column)
+          with self._phase('render'):
+            ax.set_ylabel('Density')
+            ax.legend()
+          return ax
 
         if variables is not None and num_dense is not None:
           return "You provided values for both variables and num_dense. Note that num_dense should only be provided if you want the first n density plots in the dataframe to be created. If you did intend this effect, then no value for the variable parameter should be passed. Similarly, if you wanted to to create a density plot of specific variables only, then you do not need to give a value for the num_dense parameter."
         columns = self.numeric.columns
+        n_cols = n_columns
+
+        if variables is None and num_dense is not None:
+          variables = list(columns[:num_dense])
 
         if self.autologger:
           logged_columns = []
@@ -111,54 +1287,198 @@ class EDA():
 
           for var in variables:
             if var not in self.numeric.columns:
-              print(f'{var} is not a part of the dataset or is a categorical variable, so no histogram will be created for it')
+              print(f'{var} is not a part of the dataset or is a categorical variable, so no density plot will be created for it')
             else:
-              plt.subplot(n_rows, len(variables), i)
-              sns.kdeplot(self.data[var])
-              plt.xlabel(columns[i])
+              with self._phase('compute'):
+                grid, values = self.kde(var, grid_size=grid_size, bandwidth=bandwidth)
+              with self._phase('render'):
+                plt.subplot(n_rows, n_cols, i)
+                plt.plot(grid, values)
+                plt.xlabel(var)
+                plt.ylabel('Density')
               if self.autologger:
                 logged_columns.append(var)
               i += 1
 
-          plt.tight_layout()
+          with self._phase('render'):
+            plt.tight_layout()
+
+    @_instrumented
+    def kde(self, column, grid_size=512, bandwidth='scott'):
+        """
+          Estimate the Gaussian kernel density of a numeric column on an evenly spaced grid
+
+          The column is binned onto the grid with np.histogram and the bin counts are convolved with the kernel by
+          FFT, which costs O(n + g log g) for n values and g grid points. Results are cached until the data changes
 
-    def heatmap(self, cmap='coolwarm'):
+          Args:
+            column (str): The numeric column
+            grid_size (int, optional, defaults to 512): The number of grid points
+            bandwidth (str or float, optional, defaults to 'scott'): Either scott, silverman or a fixed kernel bandwidth
+
+          Returns:
+            (grid, density) tuple of numpy arrays
+        """
+        assert column in self.numeric.columns, f'{column} is not a numeric column in the dataset'
+
+        def compute():
+            count = len(self.data) - self._null_counts()[column]
+            if count == 0:
+                return np.empty(0), np.empty(0)
+            if isinstance(bandwidth, str):
+                std = self._stats('std', [column])[column]
+                quartiles = self._quartiles([column])[column]
+                h = _kde_bandwidth(bandwidth, count, std, quartiles.loc[0.75] - quartiles.loc[0.25])
+            else:
+                h = float(bandwidth)
+            return _binned_kde(self.data[column].to_numpy(dtype=float, na_value=np.nan), h, grid_size)
+
+        return self._cached(('kde', column, grid_size, bandwidth), compute)
+
+    @_instrumented
+    def heatmap(self, cmap='coolwarm', columns=None, top_k=None, threshold=None, method='pearson', max_columns=50, annot=None):
         """
           Create a heatmap of the correlation matrix for numeric columns using seaborn
+
+          On wide data only a subset of columns is plotted: either the given columns, or the columns that take part
+          in the strongest correlations found by correlation_pairs, so the full matrix is never built
+
+          Args:
+            cmap (str, optional, defaults to 'coolwarm'): The seaborn colormap
+            columns (list, optional, defaults to None): If not none, then only these numeric columns are plotted
+            top_k (int, optional, defaults to None): If not none, then only the columns in the top_k strongest correlation pairs are plotted
+            threshold (float, optional, defaults to None): If not none, then only the columns in pairs with an absolute correlation of at least threshold are plotted
+            method (str, optional, defaults to 'pearson'): Either pearson or spearman
+            max_columns (int, optional, defaults to 50): The largest number of columns that will be plotted
+            annot (boolean, optional, defaults to None): Whether to write the correlations in the cells; if None, then only done for 20 columns or fewer
+
+        """
+        with self._phase('compute'):
+            if columns is None:
+                columns = list(self.numeric.columns)
+                if top_k is not None or threshold is not None or len(columns) > max_columns:
+                    pairs = self.correlation_pairs(method=method, top_k=top_k if top_k is not None else max_columns, threshold=threshold)
+                    # Keep the columns of the strongest pairs first, in order of appearance
+                    columns = list(dict.fromkeys(pairs[['column_1', 'column_2']].to_numpy().ravel()))
+            columns = columns[:max_columns]
+            if not columns:
+                return "No columns to plot. Either there are no numeric columns or no pair of columns meets the threshold, so pass a lower threshold or use top_k instead"
+            corr = self.data[columns].corr(method=method)
+
+        if annot is None:
+            annot = len(columns) <= 20
+        with self._phase('render'):
+            return sns.heatmap(corr, annot=annot, cmap=cmap)
+
+    @_instrumented
+    def correlation_pairs(self, method='pearson', top_k=None, threshold=None, block_size=512, workers=None):
+        """
+          Finds the most strongly correlated pairs of numeric columns without materializing the full correlation matrix
+
+          Columns are standardized into a float32 block and the correlations are computed tile by tile across a
+          thread pool, keeping only the pairs that are asked for. Null values are treated as the column mean, so
+          the results can differ slightly from DataFrame.corr on columns with nulls
+
+          Args:
+            method (str, optional, defaults to 'pearson'): Either pearson or spearman (pearson on the column ranks)
+            top_k (int, optional, defaults to None): If not none, then only the top_k pairs with the largest absolute correlation are returned
+            threshold (float, optional, defaults to None): If not none, then only the pairs with an absolute correlation of at least threshold are returned
+            block_size (int, optional, defaults to 512): The number of columns in each tile
+            workers (int, optional, defaults to None): The number of threads; if None, then the ThreadPoolExecutor default is used
+
+          Returns:
+            pd.DataFrame with the columns column_1, column_2 and correlation, sorted by absolute correlation
         """
-        return sns.heatmap(self.numeric.corr(), annot=True, cmap=cmap)
+        assert method in ('pearson', 'spearman'), 'method must be either pearson or spearman'
+        assert top_k is not None or threshold is not None, 'Pass top_k, threshold or both, otherwise every pair would be returned'
 
-    def scatter(self, x, y, n_rows=None, n_cols=None):
+        def compute():
+            numeric = self.numeric
+            return _correlation_pairs(_standardized_block(numeric, method), numeric.columns, top_k, threshold, block_size, workers)
+
+        return self._cached(('correlation_pairs', method, top_k, threshold), compute)
+
+    @_instrumented
+    def scatter(self, x, y, n_rows=None, n_cols=None, mode='auto', max_points=100_000, bins=200, random_state=0):
       """
-        Generates historgrams based on the features in the dataset
+        Generates scatter plots of pairs of features in the dataset
+
+        Above max_points rows the points are either randomly sampled or aggregated into a 2D density raster, so
+        rendering time stays flat as the number of rows grows
 
         Args:
-          all (boolean, optional, defaults to False): If True, then a density plot of every single value will be displayed
-          variables (list, optional, defaults to None): If not none, then a density plot of any column/feature in variables(and the data) will be generated; num_dense must be null if variables is not
-          num_dense (int, optional, defaults to None): If not none, then a density plot of the first n number of columns/features in the data will be generated; variables must be null if num_dense is not
-          n_rows (int, optional, defaults to None): If not none, then it is the number of rows that the display of the density plots will take up;
-          n_cols (int, optional, defaults to None): If not none, then it is the number of columns that the display of the density plots will take up; n_rows * n_columns should be greater than or equal to the number of density plots desired
-          size (int, optional, defaults to 12): Controls how big or small the display of the density plots will be
+          x (list): The columns plotted on the x axis
+          y (list): The columns plotted on the y axis; must be the same length as x
+          n_rows (int, optional, defaults to None): If not none, then it is the number of rows that the display of the scatter plots will take up;
+          n_cols (int, optional, defaults to None): If not none, then it is the number of columns that the display of the scatter plots will take up; n_rows * n_columns should be greater than or equal to the number of scatter plots desired
+          mode (str, optional, defaults to 'auto'): raw plots every point, sample plots a random sample of max_points rows, density plots a 2D histogram raster, and auto uses raw up to max_points rows and density above that
+          max_points (int, optional, defaults to 100,000): The most points drawn in raw or sample mode
+          bins (int, optional, defaults to 200): The number of bins along each axis of the density raster
+          random_state (int, optional, defaults to 0): Seed for sample mode
 
       """
 
-      assert all(var in self.columns for var in x) or all(var in self.columns for var in y) in self.columns, "One or more column provided is not in the data"
+      assert all(var in self.columns for var in x) and all(var in self.columns for var in y), "One or more column provided is not in the data"
       assert len(x) == len(y), "The lengths of independent_variables(x) list and dependent_variables(y) list must be the same"
+      assert mode in ('auto', 'raw', 'sample', 'density'), 'mode must be auto, raw, sample or density'
+
+      if mode == 'auto':
+        mode = 'raw' if len(self.data) <= max_points else 'density'
 
       if n_rows is None or n_cols is None:
             n_rows = int(len(x) ** 0.5)
             n_cols = int(len(y) / n_rows) + 1
 
+      if mode == 'sample' and len(self.data) > max_points:
+        rows = np.sort(np.random.default_rng(random_state).choice(len(self.data), max_points, replace=False))
+        data = self.data.iloc[rows]
+      else:
+        data = self.data
+
       for i, (var1, var2) in enumerate(zip(x, y), 1):
-        plt.subplot(n_rows, n_cols, i)
-        sns.scatterplot(x=self.data[var1], y=self.data[var2])
-        plt.xlabel(var1)
-        plt.ylabel(var2)
-        plt.title(f'{y} vs {x}')
+        if mode == 'density':
+          with self._phase('compute'):
+            counts, xedges, yedges = self.histogram2d(var1, var2, bins=bins)
+        with self._phase('render'):
+          plt.subplot(n_rows, n_cols, i)
+          if mode == 'density':
+            # Empty cells are left blank and the color scale is logarithmic so sparse regions stay visible
+            from matplotlib.colors import LogNorm
+            plt.pcolormesh(xedges, yedges, np.ma.masked_equal(counts.T, 0), norm=LogNorm(), cmap='viridis')
+          else:
+            sns.scatterplot(x=data[var1], y=data[var2])
+          plt.xlabel(var1)
+          plt.ylabel(var2)
+          plt.title(f'{var2} vs {var1}')
 
-        if self.autologger:
-          self.change_log(f"Correlation between {x} and {y}:", self.data[var1].corr(self.data[var2]))
+      if self.autologger:
+        # Every correlation comes from one corr call on the columns involved instead of one call per pair
+        with self._phase('compute'):
+          corr = self.data[list(dict.fromkeys([*x, *y]))].corr()
+        for var1, var2 in zip(x, y):
+          self.change_log(f"Correlation between {var1} and {var2}:", corr.loc[var1, var2])
+
+    @_instrumented
+    def histogram2d(self, x, y, bins=200):
+      """
+        2D bin counts of a pair of numeric columns, computed with np.histogram2d and cached until the data changes
+
+        Args:
+          x (str): The numeric column on the x axis
+          y (str): The numeric column on the y axis
+          bins (int, optional, defaults to 200): The number of bins along each axis
+
+        Returns:
+          (counts, x bin edges, y bin edges) tuple of numpy arrays
+      """
+      def compute():
+        values = self.data[[x, y]].to_numpy(dtype=float, na_value=np.nan)
+        values = values[np.isfinite(values).all(axis=1)]
+        return np.histogram2d(values[:, 0], values[:, 1], bins=bins)
 
+      return self._cached(('histogram2d', x, y, bins), compute)
+
+    @_instrumented
     def boxplot(self, variables=None, num_boxplots=None, n_rows=None, n_cols=None):
       """
         Generates boxplots based on the features in the dataset
@@ -192,9 +1512,10 @@ class EDA():
           if var not in self.numeric.columns:
             print(f'{var} is not a part of the dataset or is a categorical variable, so no boxplot will be created for it')
           else:
-            plt.subplot(n_rows, len(variables), i)
-            plt.boxplot(self.data[var])
-            plt.xlabel(columns[i])
+            with self._phase('render'):
+              plt.subplot(n_rows, n_cols, i)
+              plt.boxplot(self.data[var])
+              plt.xlabel(var)
             if self.autologger:
               logged_columns.append(var)
             i += 1
@@ -208,36 +1529,91 @@ class EDA():
             n_cols = int(num_box / n_rows) + 1
 
         for i in range(1, num_box + 1):
-            plt.subplot(n_rows, n_cols, i)
-            plt.boxplot(self.data[columns[i]])
-            plt.xlabel(columns[i])
+            with self._phase('render'):
+              plt.subplot(n_rows, n_cols, i)
+              plt.boxplot(self.data[columns[i - 1]])
+              plt.xlabel(columns[i - 1])
             if self.autologger:
-              logged_columns.append(columns[i])
+              logged_columns.append(columns[i - 1])
 
-      plt.tight_layout()
+      with self._phase('render'):
+        plt.tight_layout()
 
-      if self.autologger:
+      if self.autologger and logged_columns:
+        # Outliers are logged as row positions rather than copies of the data
+        with self._phase('compute'):
+          outliers = self.outliers(logged_columns)
         for col in logged_columns:
-          Q1 = self.data[col].quantile(0.25)
-          Q3 = self.data[col].quantile(0.75)
-          IQR = Q3 - Q1
-          outliers = self.data[(self.data[col] > Q3 + (IQR * 1.5)) | (self.data[col] < Q1 - (IQR * 1.5))]
-          self.change_log(f"{col} number of outliers: ", outliers.count())
-          self.change_log(f"{col} outliers", outliers)
+          self.change_log(f"{col} number of outliers: ", outliers[col]['count'])
+          self.change_log(f"{col} outliers", outliers[col]['indices'])
+
+    @_instrumented
+    def outliers(self, columns=None, approximate=False, whisker=1.5, chunksize=1_000_000):
+      """
+        Finds the values outside of the Q1 - whisker * IQR and Q3 + whisker * IQR bounds of numeric columns
 
-    def bar_graph(self, cat_columns=['all'], num_var='count', n_rows=None, n_cols=None, size=12):
+        All quartiles are computed together in one call and outliers are kept as row positions instead of copies
+        of the data; use self.data.iloc[indices] to look at the rows
+
+        Args:
+          columns (list, optional, defaults to None): The numeric columns to check; if None, every numeric column is checked
+          approximate (boolean, optional, defaults to False): If True, then the quartiles are estimated with mergeable quantile sketches over row chunks instead of being computed exactly
+          whisker (float, optional, defaults to 1.5): How many IQRs beyond the quartiles a value has to be to count as an outlier
+          chunksize (int, optional, defaults to 1,000,000): The number of rows fed to the sketches at a time when approximate is True
+
+        Returns:
+          dict mapping each column to a dict with its lower and upper bounds, number of outliers and outlier row positions
+      """
+      columns = list(self.numeric.columns if columns is None else columns)
+      assert all(column in self.numeric.columns for column in columns), 'Outliers can only be found for numeric columns in the dataset'
+
+      def compute():
+        data = self.data[columns]
+        if approximate:
+          detector = OutlierDetector(whisker=whisker)
+          for start in range(0, len(data), chunksize):
+            detector.partial_fit(data.iloc[start:start + chunksize])
+          return detector.detect(data)
+
+        quartiles = self._quartiles(columns)
+        lower, upper = _iqr_bounds(quartiles.loc[0.25].to_numpy(dtype=float), quartiles.loc[0.75].to_numpy(dtype=float), whisker)
+        return _find_outliers(data, lower, upper)
+
+      return self._cached(('outliers', tuple(columns), approximate, whisker), compute)
+
+    def _quartiles(self, columns):
+      """
+        Helper method that returns the first and third quartiles of columns as a DataFrame indexed by 0.25 and 0.75,
+        computing any uncached columns with a single quantile call
+      """
+      cache = self._current_cache()
+      missing = [column for column in columns if ('q1', column) not in cache or ('q3', column) not in cache]
+      if missing:
+        quartiles = self.data[missing].quantile([0.25, 0.75])
+        for column in missing:
+          cache[('q1', column)] = quartiles.at[0.25, column]
+          cache[('q3', column)] = quartiles.at[0.75, column]
+      return pd.DataFrame({column: [cache[('q1', column)], cache[('q3', column)]] for column in columns}, index=[0.25, 0.75])
+
+    @_instrumented
+    def bar_graph(self, cat_columns=['all'], num_var='count', n_rows=None, n_cols=None, size=12, agg='mean', top_n=20):
       """
         Generates bar_graphs based on the categorical features of the dataset
 
+        Each bar graph is drawn from one aggregation per column (see EDA.category_counts), so there is one bar per
+        category rather than per row
+
         Args:
           cat_columns (list, optional, defaults to '['all']): List of all categorical columns for bar graphs to be generated. If ['all'], then a bar graph for every single categorical column in the dataset will be displayed
           num_var (str, optional, defaults to 'count'): The numerical value that the categorical columns will be graphed on
           n_rows (int, optional, defaults to None): If not none, then it is the number of rows that the display of the bar graphs will take up;
           n_cols (int, optional, defaults to None): If not none, then it is the number of columns that the display of the bar graphs will take up; n_rows * n_columns should be greater than or equal to the number of bar graphs desired
           size (int, optional, defaults to 12): Controls how big or small the display of the bar graphs will be
+          agg (str, optional, defaults to 'mean'): How num_var is aggregated within each category when it is not count; either sum, mean or count
+          top_n (int, optional, defaults to 20): If not none, then only the top_n most frequent categories are drawn and the rest are combined into an Other bar
 
       """
-      if self.logger:
+      if self.autologger:
         logged_columns = []
 
       if cat_columns == ['all']:
@@ -249,23 +1625,341 @@ class EDA():
           n_rows = int(len(columns) ** 0.5)
           n_cols = int(len(columns) / n_rows) + 1
 
-      plt.figure(figsize=(size, size))
+      with self._phase('render'):
+        plt.figure(figsize=(size, size))
       for i, column in enumerate(columns):
-        plt.subplot(n_rows, n_cols, i + 1)
-        if num_var == 'count':
-          sns.countplot(x=column, data=self.data)
-        else:
-          assert num_var in self.numeric.columns, 'num_var must be the name of a numeric column that is in the dataset or equal to count'
-          plt.bar(self.data[column], self.data[num_var])
-        plt.xlabel(column)
-        plt.ylabel(num_var)
+        with self._phase('compute'):
+          values = self.category_counts(column, num_var=num_var, agg=agg, top_n=top_n)
+        with self._phase('render'):
+          plt.subplot(n_rows, n_cols, i + 1)
+          plt.bar(values.index.astype(str), values.to_numpy())
+          plt.xlabel(column)
+          plt.ylabel(num_var if num_var == 'count' else f'{agg} of {num_var}')
+        if self.autologger:
+          logged_columns.append(column)
 
-      plt.tight_layout()
+      with self._phase('render'):
+        plt.tight_layout()
 
       if self.autologger:
         for col in logged_columns:
-          self.change_log(f'{col} records:', [{val: val.count()} for val in self.data[col].unique()])
+          # The counts come from the same cached value_counts the plot used
+          self.change_log(f'{col} records:', self.category_counts(col, top_n=top_n).to_dict())
+
+    @_instrumented
+    def category_counts(self, column, num_var='count', agg='mean', top_n=None, other_label='Other'):
+      """
+        Aggregates a column by category with a single value_counts or groupby call
+
+        Value counts are cached per column until the data changes, so plots and logs of the same column share them
+
+        Args:
+          column (str): The categorical column
+          num_var (str, optional, defaults to 'count'): Either count or the name of a numeric column to aggregate
+          agg (str, optional, defaults to 'mean'): How num_var is aggregated within each category when it is not count; either sum, mean or count
+          top_n (int, optional, defaults to None): If not none, then only the top_n most frequent categories are kept and the rest are combined into one category
+          other_label (str, optional, defaults to 'Other'): The name of the combined category; if one of the kept categories already has this name, then the number of combined categories is added to it
+
+        Returns:
+          pd.Series indexed by category, most frequent first
+      """
+      assert column in self.columns, f'{column} is not a part of the dataset'
+      counts = self._cached(('value_counts', column), lambda: self.data[column].value_counts())
+
+      if num_var == 'count':
+        values, weights = counts, None
+      else:
+        assert num_var in self.numeric.columns, 'num_var must be the name of a numeric column that is in the dataset or equal to count'
+        assert agg in ('sum', 'mean', 'count'), 'agg must be sum, mean or count'
+        grouped = self._cached(('groupby', column, num_var), lambda: self.data.groupby(column, sort=False)[num_var].agg(['sum', 'count']))
+        # Categories are ordered by how many rows they have, the same as for counts; grouped['count'] only counts
+        # the rows where num_var is not null
+        grouped = grouped.loc[counts.index[counts.index.isin(grouped.index)]]
+        values = grouped['sum'] / grouped['count'] if agg == 'mean' else grouped[agg]
+        weights = grouped['count']
+
+      if top_n is None or len(values) <= top_n:
+        return values
+
+      top, rest = values.iloc[:top_n], values.iloc[top_n:]
+      if weights is not None and agg == 'mean':
+        # The Other mean is weighted by how many num_var values each remaining category has
+        rest_weights = weights[rest.index]
+        other = (rest * rest_weights).sum() / rest_weights.sum()
+      else:
+        other = rest.sum()
+      # A real category can have the same name, which would give two bars with one label
+      while other_label in top.index:
+        other_label = f'{other_label} ({len(rest)} categories)'
+      return pd.concat([top, pd.Series({other_label: other})])
+
+    @_instrumented
+    def render_report(self, output_dir, plots=('hist', 'density', 'boxplot', 'bar'), columns=None, fmt='png', workers=None, bins=10, grid_size=512):
+      """
+        Renders one file per plot type and column into output_dir with the Agg backend, across a process pool
+
+        The numeric columns are copied once into a shared memory block that every worker maps as a NumPy array,
+        so the data is not pickled for each task. Bar graphs are drawn from value counts computed up front
+
+        Args:
+          output_dir (str): The directory the files are written to; it is created if it does not exist
+          plots (tuple, optional, defaults to ('hist', 'density', 'boxplot', 'bar')): The plot types to render; hist, density and boxplot are drawn for numeric columns and bar for categorical columns
+          columns (list, optional, defaults to None): The columns to render; if None, every column is rendered
+          fmt (str, optional, defaults to 'png'): The file format, for example png or svg
+          workers (int, optional, defaults to None): The number of processes; if None, then the ProcessPoolExecutor default is used
+          bins (int, optional, defaults to 10): The number of bins in each histogram
+          grid_size (int, optional, defaults to 512): The number of grid points in each density plot
+
+        Returns:
+          list of the paths of the files that were written
+      """
+      assert all(plot in ('hist', 'density', 'boxplot', 'bar') for plot in plots), 'plots can only contain hist, density, boxplot and bar'
+      os.makedirs(output_dir, exist_ok=True)
+
+      columns = list(self.columns if columns is None else columns)
+      numeric_columns = [column for column in columns if column in self.numeric.columns]
+      categorical_columns = [column for column in columns if column in self.categorical.columns]
+
+      tasks = []
+      for plot in plots:
+        if plot == 'bar':
+          for column in categorical_columns:
+            counts = self.category_counts(column, top_n=20)
+            tasks.append((plot, column, None, os.path.join(output_dir, f'bar_{column}.{fmt}'), {'counts': counts}))
+        else:
+          for i, column in enumerate(numeric_columns):
+            tasks.append((plot, column, i, os.path.join(output_dir, f'{plot}_{column}.{fmt}'), {'bins': bins, 'grid_size': grid_size}))
+
+      if not tasks:
+        return []
+
+      with _shared_block(self.data[numeric_columns]) as (name, shape):
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker, initargs=(name, shape)) as executor:
+          paths = list(executor.map(_render_plot, tasks))
+
+      if self.autologger:
+        self.change_log('Report files', len(paths))
+
+      return paths
+
+    @_instrumented
+    def profile(self, workers=None):
+      """
+        Profiles every column in parallel: the columns are split across a process pool, and the numeric columns are
+        shared with the workers through one shared memory block instead of being pickled
+
+        The results are also stored in the statistics cache, so summary, check_null, outliers, remove_null and kde
+        reuse them instead of computing them again
+
+        Args:
+          workers (int, optional, defaults to None): The number of processes; if None, then the number of CPUs is used. With 1, everything runs in this process
+
+        Returns:
+          dict with the summary (like DataFrame.describe), null percentages (like check_null), outlier bounds and number of unique values of each column
+      """
+      workers = workers or os.cpu_count() or 1
+      numeric_columns = list(self.numeric.columns)
+      categorical_columns = [column for column in self.columns if column not in self.numeric.columns]
+
+      # A few column ranges per worker keep the load balanced when some columns are slower than others
+      n_tasks = min(len(numeric_columns), workers * 4)
+      bounds = np.linspace(0, len(numeric_columns), n_tasks + 1).astype(int) if n_tasks else np.array([0])
+      ranges = list(zip(bounds[:-1], bounds[1:]))
+      categorical_groups = [categorical_columns[i::workers] for i in range(workers) if categorical_columns[i::workers]]
+
+      if workers == 1:
+        block = self.data[numeric_columns].to_numpy(dtype=float, na_value=np.nan)
+        numeric_results = [_profile_numeric(block[:, start:stop]) for start, stop in ranges]
+        categorical_results = [_profile_categorical(self.data[group]) for group in categorical_groups]
+      else:
+        with _shared_block(self.data[numeric_columns]) as (name, shape):
+          with ProcessPoolExecutor(max_workers=workers, initializer=_init_shared_worker, initargs=(name, shape)) as executor:
+            categorical_futures = [executor.submit(_profile_categorical, self.data[group]) for group in categorical_groups]
+            numeric_results = list(executor.map(_profile_worker, ranges))
+            categorical_results = [future.result() for future in categorical_futures]
+
+      # Merge the column ranges back together in column order
+      if numeric_results:
+        stats = {name: np.concatenate([result[0][name] for result in numeric_results]) for name in numeric_results[0][0]}
+        numeric_nulls = np.concatenate([result[1] for result in numeric_results])
+        lower = np.concatenate([result[2] for result in numeric_results])
+        upper = np.concatenate([result[3] for result in numeric_results])
+        numeric_cardinality = np.concatenate([result[4] for result in numeric_results])
+      else:
+        stats = {name: np.empty(0) for name in ('count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max')}
+        numeric_nulls = lower = upper = numeric_cardinality = np.empty(0)
+
+      summary = pd.DataFrame(stats, index=numeric_columns).T
+      null_counts = pd.concat([pd.Series(numeric_nulls, index=numeric_columns, dtype=np.int64)] + [result[0] for result in categorical_results])[self.columns]
+      cardinality = pd.concat([pd.Series(numeric_cardinality, index=numeric_columns, dtype=np.int64)] + [result[1] for result in categorical_results])[self.columns]
+      outlier_bounds = {column: (float(lower[i]), float(upper[i])) for i, column in enumerate(numeric_columns)}
+
+      # Share the results with the other methods through the statistics cache
+      cache = self._current_cache()
+      cache['summary'] = summary
+      cache['null_counts'] = null_counts
+      # q1 and q3 are read by _quartiles, the rest by _stats
+      for name, key in (('mean', 'mean'), ('std', 'std'), ('median', '50%'), ('q1', '25%'), ('q3', '75%')):
+        for column in numeric_columns:
+          cache[(name, column)] = summary.at[key, column]
+
+      rows = max(len(self.data), 1)
+      profile = {
+        'summary': summary,
+        'null_percentages': {column: f'{round(100 * count / rows, 2)}%' for column, count in null_counts.items()},
+        'outlier_bounds': outlier_bounds,
+        'cardinality': cardinality.to_dict(),
+      }
+
+      if self.autologger:
+        self.change_log('Null percentages', profile['null_percentages'])
+        self.change_log('Outlier bounds', outlier_bounds)
+        self.change_log('Cardinality', profile['cardinality'])
+
+      return profile
+
+    @_instrumented
+    def memory_usage(self):
+      """
+        Report the memory used by each column of the data
+
+        Returns:
+          pd.DataFrame indexed by column with its dtype and the number of bytes it uses, including the contents of object columns
+      """
+      usage = pd.DataFrame({'dtype': self.data.dtypes.astype(str), 'bytes': self.data.memory_usage(index=False, deep=True)})
+
+      if self.autologger:
+        self.change_log('Memory usage (bytes)', int(usage['bytes'].sum()))
+
+      return usage
+
+    @_instrumented
+    def optimize_memory(self, category_threshold=0.5, downcast_floats=False):
+      """
+        Reduce the memory used by the data by downcasting numeric columns and storing repetitive object columns as category
+
+        Only the converted columns are replaced, so data_original keeps sharing every other column
 
+        Args:
+          category_threshold (float, optional, defaults to 0.5): An object column is converted to category when its number of unique values divided by its number of rows is at most this
+          downcast_floats (boolean, optional, defaults to False): If True, then float columns are downcast to float32 as well, which loses precision
+
+        Returns:
+          pd.DataFrame indexed by column with the dtype and bytes used before and after
+      """
+      before = self.memory_usage()
+      rows = max(len(self.data), 1)
+
+      converted = {}
+      for column, dtype in self.data.dtypes.items():
+        if pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+          converted[column] = pd.to_numeric(self.data[column], downcast='integer')
+        elif pd.api.types.is_float_dtype(dtype) and downcast_floats:
+          converted[column] = pd.to_numeric(self.data[column], downcast='float')
+        elif column in self.categorical.columns and not isinstance(dtype, pd.CategoricalDtype):
+          if self.data[column].nunique() / rows <= category_threshold:
+            converted[column] = self.data[column].astype('category')
+
+      for column, values in converted.items():
+        self.data[column] = values
+      self._data_changed()
+
+      after = self.memory_usage()
+      report = pd.DataFrame({
+        'dtype_before': before['dtype'], 'dtype_after': after['dtype'],
+        'bytes_before': before['bytes'], 'bytes_after': after['bytes'],
+      })
+
+      if self.autologger:
+        self.change_log('Memory saved by optimize_memory (bytes)', int(report['bytes_before'].sum() - report['bytes_after'].sum()))
+
+      return report
+
+    def _run_instrumented(self, method, args, kwargs):
+      """
+        Helper method that runs a public method and records its wall time, peak memory, data shape and throughput
+      """
+      outermost = not self._instrument_stack
+      record = {
+        'method': method.__name__,
+        'depth': len(self._instrument_stack),
+        'rows': len(self.data),
+        'columns': len(self.columns),
+        'phases': {},
+      }
+
+      # Only the outermost call measures memory, since resetting the peak would hide the outer call's allocations.
+      # For the same reason nothing is measured when the caller is already tracing memory itself
+      measure_memory = outermost and self.trace_memory and not tracemalloc.is_tracing()
+      if measure_memory:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+      self._instrument_stack.append(record)
+      start = time.perf_counter()
+      try:
+        return method(self, *args, **kwargs)
+      finally:
+        elapsed = time.perf_counter() - start
+        self._instrument_stack.pop()
+
+        record['wall_time_s'] = elapsed
+        record['rows_per_s'] = record['rows'] / elapsed if elapsed > 0 else None
+        record['peak_memory_bytes'] = None
+        if measure_memory:
+          record['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1] - baseline
+          tracemalloc.stop()
+        self.instrumentation.append(record)
+
+    @contextmanager
+    def _phase(self, name):
+      """
+        Helper context manager that adds the time spent inside it to the named phase (compute or render) of the
+        method call currently being recorded; does nothing when instrumentation is off
+      """
+      if not self._instrument_stack:
+        yield
+        return
+
+      record = self._instrument_stack[-1]
+      start = time.perf_counter()
+      try:
+        yield
+      finally:
+        record['phases'][f'{name}_s'] = record['phases'].get(f'{name}_s', 0.0) + time.perf_counter() - start
+
+    def instrumentation_report(self):
+      """
+        The recorded method calls as a DataFrame, one row per call in the order the calls finished
+
+        Calls made from inside another public method have a depth above 0 and no peak memory of their own; their
+        time and memory are included in the outer call. Calls made while tracemalloc was already tracing have no
+        peak memory either
+      """
+      rows = [{key: value for key, value in record.items() if key != 'phases'} | record['phases'] for record in self.instrumentation]
+      return pd.DataFrame(rows, columns=['method', 'depth', 'rows', 'columns', 'wall_time_s', 'rows_per_s', 'peak_memory_bytes', 'compute_s', 'render_s'])
+
+    def export_instrumentation(self, path=None):
+      """
+        Export the recorded method calls as JSON
+
+        Args:
+          path (str, optional, defaults to None): If not none, then the JSON is also written to this file
+
+        Returns:
+          the JSON string
+      """
+      exported = json.dumps({'calls': self.instrumentation}, indent=2)
+      if path is not None:
+        with open(path, 'w') as file:
+          file.write(exported)
+      return exported
+
+    def clear_instrumentation(self):
+      """
+        Remove every recorded method call
+      """
+      self.instrumentation = []
 
     def change_log(self, key, value):
       """
@@ -296,114 +1990,215 @@ class EDA():
         for key, value in self.logger.items():
             print(f'{key}: \t{value}')
 
+    @_instrumented
     def update_summary(self):
         """
           Recalculate summary statistics for the DataFrame
+
+          Methods of this class keep the summary up to date on their own; call this after modifying self.data in
+          place from outside the class so every cached statistic is recomputed
         """
-        self.summary = self.data.describe()
+        self._data_changed()
+        return self.summary
 
+    @_instrumented
     def remove_null(self, handle_num_nulls='median', handle_cat_nulls='mode', remove_null_under_5=False, remove_column_under_60=False):
         """
         Handles null values in the dataset
 
+        The null mask is computed once; rows are removed with a single combined filter and columns are filled with
+        a single fillna call. On a streamed instance whose data has not been changed yet, the 5% and 60% cutoffs
+        are applied to the null percentages of the full source
+
         Args:
           handle_num_nulls (str, optional, defaults to median): the value that will replace any null values found in any numerical column
           handle_cat_nulls (str, optional, defaults to mode): the value that will replace any null values found in any categorical column
-          remove_null_under_5 (boolean, optional, defaults to False): if True, then any column where null values contribute to less than or equal to 5% of the dataset will be completely removed
+          remove_null_under_5 (boolean, optional, defaults to False): if True, then any row with a null value in a column where null values contribute to less than or equal to 5% of the dataset will be removed
           remove_column_under_60 (boolean, optional, defaults to False): if True, then any column where null values contribute to more than or equal to 60% of the dataset wll be completely removed
 
         """
         # Check for null values in the DataFrame
-        null_check = self.check_null()
+        null_counts = self._null_counts()
 
-        if null_check == "No null values":
+        if null_counts.sum() == 0:
             return "No null values to be removed"
 
-        null_percentages = null_check
-
-        for column, percentage in null_percentages.items():
-            if percentage <= 5.00:
-                if remove_null_under_5:
-                    # Remove rows with null values in columns with less than 5% nulls
-                    self.data = self.data[self.data[column].notna()]
-            elif percentage >= 60.00:
-                if remove_column_under_60:
-                    # Remove columns with more than 60% nulls
-                    self.data.drop(columns=[column], inplace=True)
-            else:
-                # Handle null values based on the specified method (median or mode)
-                self._handle_null(column, self.data[column].dtype, handle_num_nulls if self.data[column].dtype != 'object' else handle_cat_nulls)
+        null_percentages = self._null_percentages()[null_counts > 0]
+
+        low_null_columns = list(null_percentages.index[null_percentages <= 5.00])
+        high_null_columns = list(null_percentages.index[null_percentages >= 60.00])
+        fill_columns = list(null_percentages.index[(null_percentages > 5.00) & (null_percentages < 60.00)])
+
+        rows_removed = 0
+        if remove_null_under_5 and low_null_columns:
+            # Remove rows with null values in columns with less than 5% nulls
+            keep = ~self._null_mask()[low_null_columns].any(axis=1)
+            rows_removed = int(len(keep) - keep.sum())
+            self.data = self.data[keep]
+
+        if remove_column_under_60 and high_null_columns:
+            # Remove columns with more than 60% nulls
+            self.data = self.data.drop(columns=high_null_columns)
+
+        if fill_columns:
+            # Handle null values based on the specified method (median or mode), computed after any rows were removed
+            numeric_columns = [column for column in fill_columns if column in self.numeric.columns]
+            categorical_columns = [column for column in fill_columns if column not in self.numeric.columns]
+            fill_values = {**self._null_fill_values(numeric_columns, handle_num_nulls, numeric=True),
+                           **self._null_fill_values(categorical_columns, handle_cat_nulls, numeric=False)}
+            self.data = self.data.fillna(fill_values)
 
-    def _handle_null(self, column, datatype, value):
+        if self.autologger:
+            self.change_log('Rows removed due to null values', rows_removed)
+            self.change_log('Columns removed due to null values', high_null_columns if remove_column_under_60 else [])
+            self.change_log('Columns with filled null values', fill_columns)
+
+    def _null_fill_values(self, columns, value, numeric):
         """
-          Helper method to handle null values in a column based on its datatype
+          Helper method that returns a {column: fill value} dictionary for the given columns and null handling option
         """
-        if datatype == 'object':
-            if value == 'mode':
-                self.data[column].fillna(self.data[column].mode().iloc[0], inplace=True)
-            else:
-                self.data[column].fillna(value, inplace=True)
-        else:
-            if value == 'mode':
-                self.data[column].fillna(self.data[column].mode().iloc[0], inplace=True)
-            elif value == 'median':
-                self.data[column].fillna(self.data[column].median(), inplace=True)
-            elif value == 'mean':
-                self.data[column].fillna(self.data[column].mean(), inplace=True)
-            else:
-                self.data[column].fillna(value, inplace=True)
+        if not columns:
+            return {}
+        if value == 'mode' or (numeric and value in ('median', 'mean')):
+            return self._stats(value, columns).to_dict()
+
+        # fillna cannot put a value into a category column (see EDA.optimize_memory) unless it is one of its categories
+        category_columns = [column for column in columns
+                            if isinstance(self.data[column].dtype, pd.CategoricalDtype) and value not in self.data[column].cat.categories]
+        if category_columns:
+            data = self.data.copy(deep=False)
+            for column in category_columns:
+                data[column] = data[column].cat.add_categories([value])
+            self.data = data
+        return {column: value for column in columns}
+
+    def _null_mask(self):
+        """
+          Helper method that returns the boolean null mask of the data, computed once per data version
+        """
+        return self._cached('null_mask', self.data.isna)
 
+    def _null_counts(self):
+        """
+          Helper method that returns the number of null values in each column, computed from the cached null mask
+        """
+        return self._cached('null_counts', lambda: self._null_mask().sum())
+
+    def _null_percentages(self):
+        """
+          Helper method that returns the percentage of null values in each column, over the full source while a
+          streamed instance is unchanged and over self.data otherwise
+        """
+        if self._describes_source():
+            return 100 * self._source_null_counts / max(self._source_rows, 1)
+        return 100 * self._null_counts() / max(len(self.data), 1)
+
+    @_instrumented
     def check_null(self):
         """
           Check for null values in the DataFrame and return a dictionary with column-wise null percentages
+
+          On a streamed instance whose data has not been changed yet, the percentages are those of the full source
         """
-        if self.data.isna().sum().sum() == 0:
+        if self._describes_source():
+            return self.null_percentages
+
+        null_counts = self._null_counts()
+        if null_counts.sum() == 0:
             return "No null values"
 
         null_percentages = {}
         for column in self.columns:
-            percentage = round(100 * self.data[column].isna().sum() / len(self.data[column]), 2)
+            percentage = round(100 * null_counts[column] / len(self.data), 2)
             null_percentages[column] = f'{percentage}%'
 
         return null_percentages
 
+    @_instrumented
+    def null_report(self, max_patterns=10):
+        """
+          Report the null values in the DataFrame from a single null mask
+
+          Args:
+            max_patterns (int, optional, defaults to 10): The number of most common row-level null patterns to include
+
+          Returns:
+            dict with the raw null count and null percentage of each column, the number of rows with at least one
+            null value, and the most common row-level null patterns as (tuple of null columns, number of rows) pairs
+        """
+        mask = self._null_mask()
+        null_counts = self._null_counts()
+        rows = len(self.data)
+
+        # Pack each row of the mask into bytes so identical patterns can be counted with one np.unique call
+        packed = np.packbits(mask.to_numpy(dtype=bool), axis=1)
+        patterns, pattern_counts = np.unique(packed, axis=0, return_counts=True)
+        order = np.argsort(-pattern_counts, kind='stable')
+
+        null_patterns = []
+        for i in order:
+            columns = tuple(self.columns[np.unpackbits(patterns[i])[:len(self.columns)].astype(bool)])
+            if columns:
+                null_patterns.append((columns, int(pattern_counts[i])))
+            if len(null_patterns) == max_patterns:
+                break
+
+        report = {
+            'null_counts': null_counts.astype(int).to_dict(),
+            'null_percentages': (100 * null_counts / rows).round(2).to_dict() if rows else {},
+            'rows_with_nulls': int(mask.any(axis=1).sum()),
+            'null_patterns': null_patterns,
+        }
+
+        if self.autologger:
+            self.change_log('Null report', report)
+
+        return report
+
+    @_instrumented
     def encode(self):
         """
         Encode categorical columns with integer labels
+
+        Each column gets its own labels, numbered in order of first appearance and stored in the smallest integer
+        dtype that fits. The fitted encoder is kept in self.encoder so new batches can be encoded the same way with
+        self.encoder.transform
         """
 
-        mapping = {}
-        for column in self.categorical:
-            for i, value in enumerate(self.data[column].unique()):
-                mapping[value] = i
-            self.data[column] = self.data[column].map(lambda x: mapping[x])
+        self.encoder = CategoricalEncoder()
+        encoded = self.encoder.fit_transform(self.data, self.categorical.columns)
+        for column in encoded.columns:
+            self.data[column] = encoded[column]
 
-        # Update the categorical and numeric attributes after encoding
-        self.categorical = pd.DataFrame()
-        self.numeric = self.data
+        # The numeric and categorical attributes pick up the encoded columns on their next use
+        self._data_changed()
 
-    def scaling(self, scaler):
+    @_instrumented
+    def scaling(self, scaler, float32=False):
         """
         Scale numeric columns using either StandardScaler or MinMaxScaler
 
+        All column parameters are computed in one vectorized pass over row chunks of the numeric columns and the
+        columns are then replaced one at a time, so memory use only grows by about one chunk and one column. The
+        fitted Scaler is kept in self.scaler, so later batches can be scaled (or unscaled) with the same parameters
+
         Args:
           Scaler (str): The type of scaling used
+          float32 (boolean, optional, defaults to False): If True, then the scaled columns are stored as float32, which halves their memory use
 
         """
 
         if scaler not in ('StandardScaler', 'MinMaxScaler'):
             return "Numeric columns were not scaled because an invalid scaling option was passed. Pass in either StandardScaler or MinMaxScaler"
 
-        if scaler == 'StandardScaler':
-            for column in self.numeric.columns:
-                mean = self.data[column].mean()
-                std = self.data[column].std()
-                self.data[column] = (self.data[column] - mean) / std
-
-        if scaler == 'MinMaxScaler':
-            for column in self.numeric.columns:
-                min_value = self.data[column].min()
-                max_value = self.data[column].max()
-                self.data[column] = (self.data[column] - min_value) / (max_value - min_value)
+        columns = self.numeric.columns
+
+        dtype = np.float32 if float32 else np.float64
+
+        self.scaler = Scaler(scaler).fit(self.data[columns])
+        for column in columns:
+            self.data[column] = self.scaler.transform_column(self.data, column, dtype=dtype)
+
+        self._data_changed()
 
         return "Numeric columns successfully scaled"
\ No newline at end of file
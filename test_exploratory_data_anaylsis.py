@@ -0,0 +1,488 @@
+import importlib.util
+import json
+import os
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import exploratory_data_anaylsis
+from exploratory_data_anaylsis import EDA, CategoricalEncoder, OutlierDetector, Scaler, _Moments, _QuantileSketch
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=5000)
+    data = pd.DataFrame({
+        'normal': rng.normal(10, 2, size=5000),
+        'skewed': rng.lognormal(size=5000),
+        'linked': base,
+        'inverse': -2 * base + rng.normal(scale=0.5, size=5000),
+    })
+    data.loc[::7, 'skewed'] = np.nan
+    return data
+
+
+def test_quantile_sketch_matches_np_quantile():
+    values = np.random.default_rng(1).lognormal(size=200_000)
+    sketch = _QuantileSketch(random_state=0)
+    for chunk in np.array_split(values, 37):
+        sketch.update(chunk)
+
+    # The sketch is approximate, so compare ranks: each returned value should sit within 1% of the asked quantile
+    q = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(q)) / len(values)
+    np.testing.assert_allclose(ranks, q, atol=0.01)
+
+
+def test_quantile_sketch_merge_matches_np_quantile():
+    values = np.random.default_rng(2).normal(size=100_000)
+    left, right = _QuantileSketch(random_state=0), _QuantileSketch(random_state=1)
+    left.update(values[:30_000])
+    right.update(values[30_000:])
+    left.merge(right)
+
+    q = np.array([0.1, 0.5, 0.9])
+    ranks = np.searchsorted(np.sort(values), left.quantile(q)) / len(values)
+    np.testing.assert_allclose(ranks, q, atol=0.01)
+
+
+def test_moments_merge_matches_describe(frame):
+    block = frame.to_numpy(dtype=float)
+    left, right = _Moments(block.shape[1]), _Moments(block.shape[1])
+    for chunk in np.array_split(block[:1234], 3):
+        left.update(chunk)
+    right.update(block[1234:])
+    left.merge(right)
+
+    describe = frame.describe()
+    np.testing.assert_allclose(left.count, describe.loc['count'])
+    np.testing.assert_allclose(left.mean, describe.loc['mean'])
+    np.testing.assert_allclose(left.std, describe.loc['std'])
+    np.testing.assert_allclose(left.min, describe.loc['min'])
+    np.testing.assert_allclose(left.max, describe.loc['max'])
+
+
+def test_from_csv_chunks_matches_describe(frame, tmp_path):
+    path = tmp_path / 'data.csv'
+    frame.to_csv(path, index=False)
+    eda = EDA.from_csv_chunks(path, chunksize=700, sample_size=1000, autologger=False)
+
+    describe = frame.describe()
+    pd.testing.assert_frame_equal(eda.summary.loc[['count', 'mean', 'std', 'min', 'max']],
+                                  describe.loc[['count', 'mean', 'std', 'min', 'max']], rtol=1e-9)
+    np.testing.assert_allclose(eda.summary.loc['50%'], describe.loc['50%'], atol=0.05 * describe.loc['std'].max())
+
+
+def test_from_csv_chunks_column_null_in_first_chunk(tmp_path):
+    path = tmp_path / 'sparse.csv'
+    pd.DataFrame({'value': np.arange(3000.0), 'label': [None] * 1000 + ['a', 'b'] * 1000}).to_csv(path, index=False)
+    eda = EDA.from_csv_chunks(path, chunksize=500, autologger=False)
+
+    assert list(eda.summary.columns) == ['value']
+    assert eda.value_counts['label'].to_dict() == {'a': 1000, 'b': 1000}
+
+
+def test_streamed_null_percentages_and_summary_describe_the_source(frame, tmp_path):
+    path = tmp_path / 'data.csv'
+    frame.to_csv(path, index=False)
+    eda = EDA.from_csv_chunks(path, chunksize=700, sample_size=300, autologger=False)
+
+    expected = {column: f'{round(100 * count / len(frame), 2)}%' for column, count in frame.isna().sum().items()}
+    assert eda.check_null() == eda.null_percentages == expected
+    assert eda.summary is eda.source_summary
+    assert eda.summary.loc['count', 'normal'] == len(frame)
+
+    # Once the sample is changed, the statistics describe the changed sample, and the source summary is kept
+    eda.remove_null()
+    assert eda.check_null() == 'No null values'
+    assert eda.summary.loc['count', 'normal'] == len(eda.data) == 300
+    assert eda.source_summary.loc['count', 'normal'] == len(frame)
+
+
+def test_streamed_value_counts_are_capped(tmp_path):
+    path = tmp_path / 'ids.csv'
+    ids = [f'id{i}' for i in range(2000)]
+    pd.DataFrame({'id': ids + ['common'] * 50, 'value': np.arange(2050.0)}).to_csv(path, index=False)
+    eda = EDA.from_csv_chunks(path, chunksize=100, max_categories=10)
+
+    counts = eda.value_counts['id']
+    assert len(counts) == 10
+    assert counts.index[0] == 'common' and counts.iloc[0] == 50
+    assert eda.logger['Columns with truncated value counts'] == ['id']
+
+
+def test_scaler_matches_manual_standardization(frame):
+    scaler = Scaler('StandardScaler', chunksize=1000).fit(frame)
+    expected = (frame - frame.mean()) / frame.std()
+    pd.testing.assert_frame_equal(scaler.transform(frame), expected, rtol=1e-9)
+    pd.testing.assert_frame_equal(scaler.inverse_transform(scaler.transform(frame)), frame, rtol=1e-9)
+
+
+def test_scaling_float32_matches_min_max(frame):
+    eda = EDA(frame, autologger=False)
+    eda.scaling('MinMaxScaler', float32=True)
+
+    expected = (frame - frame.min()) / (frame.max() - frame.min())
+    assert (eda.data.dtypes == np.float32).all()
+    pd.testing.assert_frame_equal(eda.data, expected.astype(np.float32), rtol=1e-5)
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_correlation_pairs_matches_corr(frame, method):
+    frame = frame.fillna(frame.mean())
+    eda = EDA(frame, autologger=False)
+    pairs = eda.correlation_pairs(method=method, top_k=6, workers=2, block_size=2)
+
+    corr = frame.corr(method=method)
+    assert len(pairs) == 6
+    for column_1, column_2, correlation in pairs.itertuples(index=False):
+        assert correlation == pytest.approx(corr.loc[column_1, column_2], abs=1e-5)
+    assert abs(pairs['correlation'].iloc[0]) == pytest.approx(corr.abs().where(~np.eye(len(corr), dtype=bool)).max().max(), abs=1e-5)
+
+
+def test_correlation_pairs_threshold(frame):
+    eda = EDA(frame.fillna(frame.mean()), autologger=False)
+    pairs = eda.correlation_pairs(threshold=0.5)
+
+    assert list(pairs[['column_1', 'column_2']].itertuples(index=False, name=None)) == [('linked', 'inverse')]
+    assert isinstance(eda.heatmap(threshold=0.999), str)
+
+
+def test_kde_matches_sum_of_gaussians(frame):
+    eda = EDA(frame, autologger=False)
+    h = 0.4
+    grid, density = eda.kde('normal', grid_size=1024, bandwidth=h)
+
+    # The exact Gaussian kernel density at the same bandwidth, evaluated on the same grid
+    values = frame['normal'].to_numpy()
+    expected = np.exp(-0.5 * ((grid[:, None] - values[None, :]) / h) ** 2).sum(axis=1) / (len(values) * h * np.sqrt(2 * np.pi))
+    np.testing.assert_allclose(density, expected, atol=0.01 * expected.max())
+    assert density.sum() * (grid[1] - grid[0]) == pytest.approx(1, abs=0.01)
+
+
+def test_kde_all_null_column():
+    eda = EDA(pd.DataFrame({'empty': [np.nan] * 10, 'value': np.arange(10.0)}), autologger=False)
+    grid, density = eda.kde('empty')
+    assert len(grid) == len(density) == 0
+
+
+def test_data_original_is_not_modified():
+    rng = np.random.default_rng(3)
+    original = pd.DataFrame({
+        'value': rng.normal(size=200),
+        'count': rng.integers(0, 100, size=200),
+        'label': rng.choice(['a', 'b', 'c'], size=200).astype(object),
+        'code': rng.choice(['x', 'y'], size=200).astype(object),
+    })
+    original.loc[::9, 'value'] = np.nan
+    original.loc[::11, 'label'] = None
+    snapshot = original.copy(deep=True)
+
+    eda = EDA(original, autologger=False)
+    eda.optimize_memory(downcast_floats=True)
+    eda.remove_null(handle_cat_nulls='missing')
+    eda.encode()
+    eda.scaling('StandardScaler', float32=True)
+
+    assert eda.data_original is original
+    pd.testing.assert_frame_equal(eda.data_original, snapshot)
+    assert not eda.data.equals(snapshot)
+
+
+@pytest.fixture
+def mixed_frame(frame):
+    rng = np.random.default_rng(4)
+    mixed = frame.assign(
+        count=rng.integers(0, 20, size=len(frame)),
+        label=rng.choice(['a', 'b', 'c', None], size=len(frame)),
+        empty=np.nan,
+    )
+    mixed.loc[::13, 'normal'] = np.nan
+    return mixed
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_profile_matches_describe_check_null_and_nunique(mixed_frame, workers):
+    profile = EDA(mixed_frame, autologger=False).profile(workers=workers)
+    reference = EDA(mixed_frame, autologger=False)
+
+    pd.testing.assert_frame_equal(profile['summary'], mixed_frame.describe(), check_dtype=False)
+    assert profile['null_percentages'] == reference.check_null()
+    assert profile['cardinality'] == mixed_frame.nunique().to_dict()
+
+
+def test_profile_fills_the_cache_that_outliers_and_kde_read(mixed_frame, monkeypatch):
+    eda = EDA(mixed_frame, autologger=False)
+    profile = eda.profile(workers=1)
+
+    cache = eda._current_cache()
+    assert cache['summary'] is profile['summary']
+    pd.testing.assert_series_equal(cache['null_counts'], mixed_frame.isna().sum(), check_dtype=False)
+    columns = profile['summary'].columns
+    np.testing.assert_array_equal([cache[('q1', column)] for column in columns], profile['summary'].loc['25%'])
+    np.testing.assert_array_equal([cache[('q3', column)] for column in columns], profile['summary'].loc['75%'])
+
+    # Nothing may be recomputed from the data, so outliers and kde can only have read the cached values
+    def recompute(*args, **kwargs):
+        raise AssertionError('statistic was recomputed instead of read from the cache')
+    monkeypatch.setattr(pd.DataFrame, 'quantile', recompute)
+    monkeypatch.setattr(pd.DataFrame, 'isna', recompute)
+    monkeypatch.setitem(exploratory_data_anaylsis._COLUMN_STATS, 'std', recompute)
+
+    outliers = eda.outliers(columns=['normal', 'skewed'])
+    for column in ('normal', 'skewed'):
+        assert (outliers[column]['lower'], outliers[column]['upper']) == pytest.approx(profile['outlier_bounds'][column])
+
+    summary = profile['summary']['normal']
+    h = exploratory_data_anaylsis._kde_bandwidth('silverman', summary['count'], summary['std'], summary['75%'] - summary['25%'])
+    values = mixed_frame['normal'].to_numpy()
+    np.testing.assert_allclose(eda.kde('normal', bandwidth='silverman')[1], exploratory_data_anaylsis._binned_kde(values, h, 512)[1])
+
+
+def test_encoder_labels_are_per_column():
+    data = pd.DataFrame({'first': ['x', 'y', 'x'], 'second': ['y', 'z', 'x']})
+    encoded = CategoricalEncoder().fit_transform(data)
+
+    assert encoded['first'].tolist() == [0, 1, 0]
+    assert encoded['second'].tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize('n_categories, dtype', [(127, np.int8), (128, np.int8), (129, np.int16)])
+def test_encoder_picks_the_smallest_integer_dtype(n_categories, dtype):
+    data = pd.DataFrame({'column': [f'value{i}' for i in range(n_categories)]})
+    encoder = CategoricalEncoder()
+
+    assert encoder.fit_transform(data)['column'].dtype == dtype
+    assert encoder.transform(data)['column'].dtype == dtype
+
+
+def test_encoder_transform_unseen_values_and_nulls():
+    encoder = CategoricalEncoder().fit(pd.DataFrame({'column': ['a', None, 'b']}))
+    encoded = encoder.transform(pd.DataFrame({'column': ['b', np.nan, 'c', 'a']}))
+
+    # NaN gets the label of the None seen during fitting, and the unseen value c gets -1
+    assert encoded['column'].tolist() == [2, 1, -1, 0]
+
+
+def test_encoder_inverse_transform_round_trip():
+    data = pd.DataFrame({'first': ['x', None, 'y', 'x'], 'second': pd.Categorical(['p', 'q', 'q', None])})
+    encoder = CategoricalEncoder()
+    decoded = encoder.inverse_transform(encoder.fit_transform(data))
+
+    for column in data.columns:
+        assert decoded[column].astype(object).fillna('null').tolist() == data[column].astype(object).fillna('null').tolist()
+    assert encoder.inverse_transform(pd.DataFrame({'first': [-1]}))['first'].isna().all()
+
+
+def test_encode_picks_up_string_columns():
+    data = pd.DataFrame({'text': pd.array(['a', 'b', 'a'], dtype='string'), 'label': ['u', 'v', 'v'], 'value': [1.0, 2.0, 3.0]})
+    eda = EDA(data, autologger=False)
+    eda.encode()
+
+    assert set(eda.encoder.mappings) == {'text', 'label'}
+    assert eda.data['text'].tolist() == [0, 1, 0]
+
+
+@pytest.fixture
+def null_frame():
+    rng = np.random.default_rng(5)
+    data = pd.DataFrame({
+        'low': rng.normal(size=100),
+        'low_too': rng.normal(size=100),
+        'mid': rng.normal(size=100),
+        'label': rng.choice(['a', 'b'], p=[0.3, 0.7], size=100).astype(object),
+        'high': rng.normal(size=100),
+        'full': rng.normal(size=100),
+    })
+    data.loc[0:4, 'low'] = np.nan         # 5%
+    data.loc[3:5, 'low_too'] = np.nan     # 3%, overlapping low on rows 3 and 4
+    data.loc[50:69, 'mid'] = np.nan       # 20%
+    data.loc[70:99, 'label'] = None       # 30%
+    data.loc[0:59, 'high'] = np.nan       # 60%
+    return data
+
+
+def test_remove_null_drops_rows_and_columns(null_frame):
+    eda = EDA(null_frame)
+    eda.remove_null(remove_null_under_5=True, remove_column_under_60=True)
+
+    # Rows 0 to 5 have nulls in the columns at 5% or fewer; the nulls of every other column do not drop rows
+    assert eda.data.index.tolist() == list(range(6, 100))
+    assert list(eda.data.columns) == ['low', 'low_too', 'mid', 'label', 'full']
+    assert eda.logger['Rows removed due to null values'] == 6
+    assert eda.logger['Columns removed due to null values'] == ['high']
+    assert eda.data.isna().sum().sum() == 0
+
+
+def test_remove_null_fills_with_one_fillna_call(null_frame, monkeypatch):
+    calls = []
+    fillna = pd.DataFrame.fillna
+    monkeypatch.setattr(pd.DataFrame, 'fillna', lambda self, *args, **kwargs: calls.append(args or kwargs) or fillna(self, *args, **kwargs))
+
+    eda = EDA(null_frame, autologger=False)
+    eda.remove_null(remove_null_under_5=True)
+    kept = null_frame.iloc[6:]
+
+    assert len(calls) == 1
+    # The fill values come from the rows that are left after the row filter
+    assert (eda.data.loc[50:69, 'mid'] == kept['mid'].median()).all()
+    assert (eda.data.loc[70:99, 'label'] == kept['label'].mode()[0]).all()
+    # Columns at 60% or more are left alone unless remove_column_under_60 is set
+    assert eda.data['high'].isna().sum() == 54
+
+
+def test_null_report(null_frame):
+    eda = EDA(null_frame, autologger=False)
+    report = eda.null_report()
+
+    assert report['null_counts'] == null_frame.isna().sum().to_dict()
+    assert report['null_percentages']['high'] == 60.0
+    assert report['rows_with_nulls'] == 100
+    assert sorted(report['null_patterns']) == sorted([
+        (('low', 'high'), 3), (('low', 'low_too', 'high'), 2), (('low_too', 'high'), 1),
+        (('high',), 44), (('mid', 'high'), 10), (('mid',), 10), (('label',), 30),
+    ])
+    assert eda.null_report(max_patterns=2)['null_patterns'] == [(('high',), 44), (('label',), 30)]
+
+
+def test_outliers_match_a_per_column_iqr_reference(frame):
+    results = EDA(frame, autologger=False).outliers(whisker=1.5)
+
+    for column in frame.columns:
+        Q1, Q3 = frame[column].quantile([0.25, 0.75])
+        lower, upper = Q1 - 1.5 * (Q3 - Q1), Q3 + 1.5 * (Q3 - Q1)
+        expected = np.flatnonzero((frame[column] < lower) | (frame[column] > upper))
+        assert (results[column]['lower'], results[column]['upper']) == pytest.approx((lower, upper))
+        assert results[column]['count'] == len(expected)
+        np.testing.assert_array_equal(results[column]['indices'], expected)
+
+
+def test_approximate_outliers_are_close_to_exact(frame):
+    eda = EDA(frame, autologger=False)
+    exact = eda.outliers()
+    approximate = eda.outliers(approximate=True, chunksize=700)
+
+    for column in frame.columns:
+        Q1, Q3 = frame[column].quantile([0.25, 0.75])
+        tolerance = 0.05 * (Q3 - Q1)
+        assert approximate[column]['lower'] == pytest.approx(exact[column]['lower'], abs=tolerance)
+        assert approximate[column]['upper'] == pytest.approx(exact[column]['upper'], abs=tolerance)
+        assert abs(approximate[column]['count'] - exact[column]['count']) <= 0.01 * len(frame)
+
+
+def test_outlier_detector_merge_matches_single_pass(frame):
+    single = OutlierDetector().partial_fit(frame)
+    left, right = OutlierDetector().partial_fit(frame.iloc[:2000]), OutlierDetector().partial_fit(frame.iloc[2000:])
+    merged = left.merge(right)
+
+    assert list(merged.columns) == list(frame.columns)
+    for column, (lower, upper) in single.bounds().items():
+        assert merged.bounds()[column] == pytest.approx((lower, upper), rel=0.05)
+
+
+def test_statistics_only_use_does_not_import_plotting_libraries():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'check_import.py')
+    spec = importlib.util.spec_from_file_location('check_import', path)
+    check_import = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(check_import)
+
+    assert check_import.run_probe()['plotting_modules'] == []
+
+
+def test_render_report_writes_files_and_unlinks_the_shared_block(tmp_path, monkeypatch):
+    shared_memory = exploratory_data_anaylsis.shared_memory
+    SharedMemory = shared_memory.SharedMemory
+    created = []
+
+    def recording_shared_memory(*args, **kwargs):
+        shared = SharedMemory(*args, **kwargs)
+        if kwargs.get('create'):
+            created.append(shared.name)
+        return shared
+    monkeypatch.setattr(shared_memory, 'SharedMemory', recording_shared_memory)
+
+    data = pd.DataFrame({'first': np.arange(50.0), 'second': np.r_[np.nan, np.arange(49.0)], 'label': ['a', 'b'] * 25})
+    paths = EDA(data, autologger=False).render_report(tmp_path, workers=2)
+
+    expected = [f'{plot}_{column}.png' for plot in ('hist', 'density', 'boxplot') for column in ('first', 'second')] + ['bar_label.png']
+    assert sorted(os.path.basename(path) for path in paths) == sorted(expected)
+    assert all(os.path.getsize(tmp_path / name) > 0 for name in expected)
+
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=created[0])
+
+
+def test_instrumentation_report_records_nested_calls(frame):
+    eda = EDA(frame, autologger=False, instrument=True)
+    eda.optimize_memory()
+    report = eda.instrumentation_report()
+
+    # optimize_memory calls memory_usage before and after converting, and the outer call finishes last
+    assert report['method'].tolist() == ['memory_usage', 'memory_usage', 'optimize_memory']
+    assert report['depth'].tolist() == [1, 1, 0]
+    assert report['peak_memory_bytes'].isna().tolist() == [True, True, False]
+    assert report.loc[2, 'peak_memory_bytes'] > 0
+    assert (report['rows'] == len(frame)).all()
+    assert report.loc[2, 'wall_time_s'] >= report.loc[0, 'wall_time_s'] + report.loc[1, 'wall_time_s']
+
+
+def test_instrumentation_leaves_the_callers_tracing_alone(frame):
+    eda = EDA(frame, autologger=False, instrument=True)
+    tracemalloc.start()
+    try:
+        big = np.ones(1_000_000)
+        del big
+        peak = tracemalloc.get_traced_memory()[1]
+        eda.check_null()
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] >= peak
+    finally:
+        tracemalloc.stop()
+    assert eda.instrumentation[-1]['peak_memory_bytes'] is None
+
+
+def test_export_instrumentation_is_valid_json(frame, tmp_path):
+    eda = EDA(frame, autologger=False, instrument=True)
+    eda.check_null()
+    eda.outliers()
+    path = tmp_path / 'calls.json'
+    exported = json.loads(eda.export_instrumentation(path))
+
+    assert exported == json.loads(path.read_text())
+    assert [call['method'] for call in exported['calls']] == ['check_null', 'outliers']
+    assert all(call['wall_time_s'] >= 0 and 'phases' in call for call in exported['calls'])
+
+
+@pytest.fixture
+def category_frame():
+    labels = ['a'] * 40 + ['b'] * 30 + ['c'] * 20 + ['d'] * 10
+    values = np.r_[np.full(40, 1.0), np.full(30, 2.0), np.full(10, 3.0), np.full(10, np.nan), np.full(10, 6.0)]
+    return pd.DataFrame({'label': labels, 'value': values})
+
+
+def test_category_counts_top_n_with_other(category_frame):
+    counts = EDA(category_frame, autologger=False).category_counts('label', top_n=2)
+
+    assert counts.to_dict() == {'a': 40, 'b': 30, 'Other': 30}
+
+
+def test_category_counts_other_mean_is_weighted(category_frame):
+    eda = EDA(category_frame, autologger=False)
+    means = eda.category_counts('label', num_var='value', agg='mean', top_n=2)
+    sums = eda.category_counts('label', num_var='value', agg='sum', top_n=2)
+
+    # c has 20 rows but only 10 values, so Other is (10 * 3 + 10 * 6) / 20 rather than the mean of the two means
+    assert means.to_dict() == pytest.approx({'a': 1.0, 'b': 2.0, 'Other': 4.5})
+    assert sums.to_dict() == pytest.approx({'a': 40.0, 'b': 60.0, 'Other': 90.0})
+
+
+def test_category_counts_other_label_does_not_collide(category_frame):
+    data = category_frame.replace({'label': {'a': 'Other'}})
+    counts = EDA(data, autologger=False).category_counts('label', top_n=2)
+
+    assert counts.index.is_unique
+    assert counts.to_dict() == {'Other': 40, 'b': 30, 'Other (2 categories)': 30}